@@ -1,320 +1,527 @@
-import asyncio
-import json
-import os
-import aiohttp
-import logging
-from typing import Any, Dict, List, Optional
-
-from mcp.server.models import InitializationOptions
-import mcp.types as types
-from mcp.server import NotificationOptions, Server
-from pydantic import AnyUrl
-import mcp.server.stdio
-
-# Store notes as a simple key-value dict to demonstrate state management
-logger = logging.getLogger(__name__)
-notes: dict[str, str] = {}
-search_results: dict[str, str] = {}  # Store search results
-
-server = Server("Scout")
-
-CONFIG_FILE_PATH = os.path.expanduser(r"")
-
-
-def load_openai_config() -> Dict[str, Any]:
-    """
-    Load OpenAI configuration from the claude desktop config file.
-    Returns a dictionary with openai_api_key and openai_model.
-    """
-    try:
-        logger.info(f"Reading configuration from: {CONFIG_FILE_PATH}")
-        with open(CONFIG_FILE_PATH, 'r') as config_file:
-            config = json.load(config_file)
-        
-        # Navigate through the correct config structure
-        if 'mcpServers' not in config:
-            raise ValueError("Missing 'mcpServers' section in config file")
-            
-        if 'Scout' not in config['mcpServers']:
-            raise ValueError("Missing 'Scout' section in mcpServers config")
-            
-        if 'env' not in config['mcpServers']['Scout']:
-            raise ValueError("Missing 'env' section in Scout config")
-            
-        env_config = config['mcpServers']['Scout']['env']
-        
-        # Check for required fields
-        if 'OPENAI_API_KEY' not in env_config:
-            raise ValueError("Missing OPENAI_API_KEY in configuration")
-            
-        if 'OPENAI_MODEL' not in env_config:
-            logger.warning("OPENAI_MODEL not specified, defaulting to gpt-4")
-            env_config['OPENAI_MODEL'] = 'gpt-4'
-
-        return {
-            "openai_api_key": env_config['OPENAI_API_KEY'],
-            "openai_model": env_config['OPENAI_MODEL']
-        }
-        
-    except FileNotFoundError:
-        logger.error(f"Configuration file not found: {CONFIG_FILE_PATH}")
-        raise ValueError(f"Configuration file not found: {CONFIG_FILE_PATH}")
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in configuration file: {CONFIG_FILE_PATH}")
-        raise ValueError(f"Invalid JSON in configuration file: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error loading configuration: {str(e)}")
-        raise ValueError(f"Error loading configuration: {str(e)}")
-
-
-
-@server.list_resources()
-async def handle_list_resources() -> list[types.Resource]:
-    """
-    List available note and search resources.
-    Each note and search result is exposed as a resource with a custom URI scheme.
-    """
-    note_resources = [
-        types.Resource(
-            uri=AnyUrl(f"note://internal/{name}"),
-            name=f"Note: {name}",
-            description=f"A simple note named {name}",
-            mimeType="text/plain",
-        )
-        for name in notes
-    ]
-    
-    search_resources = [
-        types.Resource(
-            uri=AnyUrl(f"search://result/{name}"),
-            name=f"Search: {name}",
-            description=f"Web search result for query '{name}'",
-            mimeType="text/plain",
-        )
-        for name in search_results
-    ]
-    
-    return note_resources + search_resources
-
-@server.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
-    """
-    Read a specific note or search result's content by its URI.
-    """
-    if uri.scheme == "search":
-        name = uri.path.lstrip("/")
-        if name in search_results:
-            return search_results[name]
-        raise ValueError(f"Search result not found: {name}")
-    
-    raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
-
-@server.list_prompts()
-async def handle_list_prompts() -> list[types.Prompt]:
-    """
-    List available prompts for notes and search results.
-    """
-    return [
-        types.Prompt(
-            name="summarize-search",
-            description="Creates a summary of search results",
-            arguments=[
-                types.PromptArgument(
-                    name="style",
-                    description="Style of the summary (brief/detailed)",
-                    required=False,
-                )
-            ],
-        )
-    ]
-
-@server.get_prompt()
-async def handle_get_prompt(
-    name: str, arguments: dict[str, str] | None
-) -> types.GetPromptResult:
-    """
-    Generate a prompt by combining arguments with server state.
-    Supports prompts for notes and search results.
-    """
-    if name == "summarize-notes":
-        style = (arguments or {}).get("style", "brief")
-        detail_prompt = " Give extensive details." if style == "detailed" else ""
-
-        return types.GetPromptResult(
-            description="Summarize the current notes",
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(
-                        type="text",
-                        text=f"Here are the current notes to summarize:{detail_prompt}\n\n"
-                        + "\n".join(
-                            f"- {name}: {content}"
-                            for name, content in notes.items()
-                        ),
-                    ),
-                )
-            ],
-        )
-    
-    elif name == "summarize-search":
-        style = (arguments or {}).get("style", "brief")
-        detail_prompt = " Give extensive details." if style == "detailed" else ""
-
-        return types.GetPromptResult(
-            description="Summarize the current search results",
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(
-                        type="text",
-                        text=f"Here are the current search results to summarize:{detail_prompt}\n\n"
-                        + "\n".join(
-                            f"- {name}: {content}"
-                            for name, content in search_results.items()
-                        ),
-                    ),
-                )
-            ],
-        )
-    
-    raise ValueError(f"Unknown prompt: {name}")
-
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """
-    List available tools, including web search and note management.
-    """
-    return [
-        types.Tool(
-            name="web-search",
-            description="Perform a web search using OpenAI's API",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"},
-                    "name": {"type": "string", "description": "Name to save the search result"},
-                    "max_results": {
-                        "type": "integer", 
-                        "description": "Maximum number of search results",
-                        "minimum": 1,
-                        "maximum": 10,
-                        "default": 5
-                    }
-                },
-                "required": ["query", "name"]
-            },
-        )
-    ]
-
-@server.call_tool()
-async def handle_call_tool(
-    name: str, 
-    arguments: Optional[dict]
-) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """
-    Handle tool execution requests for adding notes and web searching.
-    """
-
-    try:
-        if name != "web-search":
-            return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
-
-        if not arguments:
-            return [types.TextContent(type="text", text="Arguments are required")]
-
-        # Convert max_results from string to int if needed
-        if 'max_results' in arguments:
-            try:
-                arguments['max_results'] = int(arguments['max_results'])
-            except (ValueError, TypeError):
-                arguments['max_results'] = 5
-
-        # Load configuration
-        try:
-            config = load_openai_config()
-        except Exception as e:
-            logger.error(f"Failed to load OpenAI config: {str(e)}")
-            return [types.TextContent(type="text", text=f"Configuration error: {str(e)}")]
-        
-        # Validate OpenAI configuration
-        openai_api_key = config.get('openai_api_key')
-        if not openai_api_key:
-            return [types.TextContent(type="text", text="OpenAI API key not found in configuration")]
-
-        openai_model = config.get('openai_model', 'gpt-3.5-turbo')
-
-        # Validate required arguments
-        if 'query' not in arguments:
-            return [types.TextContent(type="text", text="Search query is required")]
-        if 'name' not in arguments:
-            return [types.TextContent(type="text", text="Name is required")]
-
-        query = arguments['query']
-        name = arguments['name']
-        max_results = arguments.get('max_results', 5)
-
-        # Perform web search using OpenAI API
-        async with aiohttp.ClientSession() as session:
-            headers = {
-                "Authorization": f"Bearer {openai_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "model": openai_model,
-                "messages": [
-                    {
-                        "role": "user", 
-                        "content": f"Web search results for: {query}. "
-                                 f"Provide {max_results} concise, relevant results."
-                    }
-                ],
-                "max_tokens": 1000
-            }
-            
-            async with session.post(
-                "https://api.openai.com/v1/chat/completions", 
-                headers=headers, 
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    return [types.TextContent(type="text", text=f"OpenAI API error: {error_text}")]
-                
-                result = await response.json()
-                search_content = result['choices'][0]['message']['content']
-                
-                # Store search results in the global dictionary
-                global search_results
-                search_results[name] = search_content
-
-                # Notify clients that resources have changed
-                if hasattr(server.request_context.session, 'send_resource_list_changed'):
-                    await server.request_context.session.send_resource_list_changed()
-
-                return [types.TextContent(
-                    type="text",
-                    text=f"Saved search results for '{name}': {search_content}"
-                )]
-
-    except Exception as e:
-        logger.error(f"Error in web search tool: {str(e)}")
-        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
-
-# Rest of the existing main function remains the same
-async def main():
-    # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="Scout",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
+import asyncio
+import json
+import os
+import re
+import sys
+import aiohttp
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from mcp.server.models import InitializationOptions
+import mcp.types as types
+from mcp.server import NotificationOptions, Server
+from pydantic import AnyUrl
+import mcp.server.stdio
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode than stdlib
+except ImportError:
+    orjson = None
+
+# Store notes as a simple key-value dict to demonstrate state management
+logger = logging.getLogger(__name__)
+notes: dict[str, str] = {}
+search_results: dict[str, str] = {}  # Store search results
+
+server = Server("Scout")
+
+# Bound once at module scope so prompt building skips per-line attribute
+# lookups and never materializes an intermediate list
+_NOTE_LINE_FMT = "- {}: {}".format
+
+# Bound locally so hot-path returns skip the types.* attribute lookup
+TextContent = types.TextContent
+
+# Interned argument keys so repeated dict lookups reuse the cached hash
+_K_QUERY = sys.intern('query')
+_K_NAME = sys.intern('name')
+_K_MAX_RESULTS = sys.intern('max_results')
+
+# Pre-built responses for the constant error strings; the server never
+# mutates returned content, so the same lists can be reused
+_ERR_NO_ARGS = [TextContent(type="text", text="Arguments are required")]
+_ERR_NO_QUERY = [TextContent(type="text", text="Search query is required")]
+_ERR_NO_NAME = [TextContent(type="text", text="Name is required")]
+_ERR_NO_API_KEY = [TextContent(type="text", text="OpenAI API key not found in configuration")]
+
+CONFIG_FILE_PATH = os.path.expanduser(r"")
+
+# Parsed config cached against the file's mtime so repeated tool calls
+# skip the disk read + JSON parse while the file is unchanged. The request
+# headers are pre-built at cache time so the hot path never re-formats them.
+_config_cache: Optional[tuple[int, Dict[str, Any], Dict[str, str]]] = None
+
+# Shared HTTP session so every web search reuses the same connection pool
+# instead of paying a TCP+TLS handshake per call
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared aiohttp session, creating it lazily on first use.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+
+# Bound notification method cached after the first hasattr-style probe;
+# False means the session has no send_resource_list_changed
+_notify_fn: Optional[Callable] = None
+
+
+async def _notify_resources_changed() -> None:
+    """Notify the client that the resource list changed, probing only once."""
+    global _notify_fn
+    if _notify_fn is None:
+        _notify_fn = getattr(
+            server.request_context.session, 'send_resource_list_changed', False
+        )
+    if _notify_fn:
+        await _notify_fn()
+
+
+# Micro-batching of concurrent searches: queries arriving within a short
+# window are coalesced into a single numbered chat-completion request
+_BATCH_WINDOW = 0.01  # seconds to wait for more queries before flushing
+_BATCH_MAX = 8
+_pending: List[tuple[str, int, asyncio.Future]] = []
+_batch_task: Optional[asyncio.Task] = None
+
+# Static request parts built once; per-call payloads copy the template
+# instead of re-allocating the constant fields
+_PAYLOAD_TEMPLATE = {"max_tokens": 1000, "stream": True}
+_PROMPT_FMT = "Web search results for: {query}. Provide {n} concise, relevant results.".format
+
+
+async def _post_chat(api_key: str, model: str, content: str) -> str:
+    """Send one chat-completion request and return the reply text."""
+    session = await get_session()
+    if _config_cache is not None and _config_cache[1].get('openai_api_key') == api_key:
+        headers = _config_cache[2]
+    else:
+        headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+    payload = _PAYLOAD_TEMPLATE.copy()
+    payload["model"] = model
+    payload["messages"] = [{"role": "user", "content": content}]
+
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode()
+
+    async with session.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers=headers,
+        data=body
+    ) as response:
+        if response.status != 200:
+            error_text = await response.text()
+            raise ValueError(f"OpenAI API error: {error_text}")
+
+        # Consume the SSE stream chunk by chunk instead of buffering the
+        # whole completion before extracting the message content
+        loads = orjson.loads if orjson is not None else json.loads
+        parts: List[str] = []
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(b"data: "):
+                continue
+            data = line[6:]
+            if data == b"[DONE]":
+                break
+            delta = loads(data)['choices'][0]['delta']
+            piece = delta.get('content')
+            if piece:
+                parts.append(piece)
+        return "".join(parts)
+
+
+def _split_numbered_reply(reply: str, count: int) -> List[str]:
+    """Split a numbered batch reply into one answer per query."""
+    parts = re.split(r"(?m)^\s*\d+[.)]\s+", reply)
+    answers = [part.strip() for part in parts if part.strip()]
+    if len(answers) != count:
+        # Could not split cleanly; give every caller the full reply
+        return [reply] * count
+    return answers
+
+
+async def _drain_pending(api_key: str, model: str) -> None:
+    """Flush all queued searches as one OpenAI request."""
+    global _batch_task
+    _batch_task = None
+    batch = _pending[:]
+    del _pending[:]
+    if not batch:
+        return
+
+    try:
+        if len(batch) == 1:
+            query, max_results, future = batch[0]
+            reply = await _post_chat(
+                api_key, model, _PROMPT_FMT(query=query, n=max_results)
+            )
+            if not future.done():
+                future.set_result(reply)
+            return
+
+        lines = [
+            "Answer each numbered web-search query separately. "
+            "Start each answer with its number followed by a period."
+        ]
+        for i, (query, max_results, _) in enumerate(batch, 1):
+            lines.append(f"{i}. {_PROMPT_FMT(query=query, n=max_results)}")
+        reply = await _post_chat(api_key, model, "\n".join(lines))
+
+        answers = _split_numbered_reply(reply, len(batch))
+        for (_, _, future), answer in zip(batch, answers):
+            if not future.done():
+                future.set_result(answer)
+    except BaseException as e:
+        # BaseException so a cancelled request task can't escape after the
+        # queue was emptied and leave the other callers' futures hanging
+        for _, _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        if not isinstance(e, Exception):
+            raise
+
+
+async def _flush_after_window(api_key: str, model: str) -> None:
+    await asyncio.sleep(_BATCH_WINDOW)
+    await _drain_pending(api_key, model)
+
+
+async def _search_web(query: str, max_results: int, api_key: str, model: str) -> str:
+    """Queue a search and wait for its slice of the batched reply."""
+    global _batch_task
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future = loop.create_future()
+    _pending.append((query, max_results, future))
+
+    if len(_pending) >= _BATCH_MAX:
+        # Full batch: flush immediately instead of waiting out the window.
+        # The flush runs shielded so cancelling the triggering request
+        # doesn't abort the shared drain mid-flight for everyone else
+        if _batch_task is not None and not _batch_task.done():
+            _batch_task.cancel()
+        await asyncio.shield(_drain_pending(api_key, model))
+    elif _batch_task is None or _batch_task.done():
+        _batch_task = loop.create_task(_flush_after_window(api_key, model))
+
+    return await future
+
+
+def load_openai_config() -> Dict[str, Any]:
+    """
+    Load OpenAI configuration from the claude desktop config file.
+    Returns a dictionary with openai_api_key and openai_model.
+    """
+    global _config_cache
+    try:
+        mtime_ns = os.stat(CONFIG_FILE_PATH).st_mtime_ns
+        if _config_cache is not None and _config_cache[0] == mtime_ns:
+            return _config_cache[1]
+
+        logger.info("Reading configuration from: %s", CONFIG_FILE_PATH)
+        with open(CONFIG_FILE_PATH, 'r') as config_file:
+            if orjson is not None:
+                config = orjson.loads(config_file.read())
+            else:
+                config = json.load(config_file)
+
+        # Navigate through the correct config structure
+        if 'mcpServers' not in config:
+            raise ValueError("Missing 'mcpServers' section in config file")
+            
+        if 'Scout' not in config['mcpServers']:
+            raise ValueError("Missing 'Scout' section in mcpServers config")
+            
+        if 'env' not in config['mcpServers']['Scout']:
+            raise ValueError("Missing 'env' section in Scout config")
+            
+        env_config = config['mcpServers']['Scout']['env']
+        
+        # Check for required fields
+        if 'OPENAI_API_KEY' not in env_config:
+            raise ValueError("Missing OPENAI_API_KEY in configuration")
+            
+        if 'OPENAI_MODEL' not in env_config:
+            logger.warning("OPENAI_MODEL not specified, defaulting to gpt-4")
+            env_config['OPENAI_MODEL'] = 'gpt-4'
+
+        result = {
+            "openai_api_key": env_config['OPENAI_API_KEY'],
+            "openai_model": env_config['OPENAI_MODEL']
+        }
+        headers = {
+            "Authorization": f"Bearer {result['openai_api_key']}",
+            "Content-Type": "application/json"
+        }
+        _config_cache = (mtime_ns, result, headers)
+        return result
+
+    except FileNotFoundError:
+        logger.error("Configuration file not found: %s", CONFIG_FILE_PATH)
+        raise ValueError(f"Configuration file not found: {CONFIG_FILE_PATH}")
+    except json.JSONDecodeError as e:
+        logger.error("Invalid JSON in configuration file: %s", CONFIG_FILE_PATH)
+        raise ValueError(f"Invalid JSON in configuration file: {str(e)}")
+    except Exception as e:
+        logger.error("Error loading configuration: %s", e)
+        raise ValueError(f"Error loading configuration: {str(e)}")
+
+
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """
+    List available note and search resources.
+    Each note and search result is exposed as a resource with a custom URI scheme.
+    """
+    note_resources = [
+        types.Resource(
+            uri=AnyUrl(f"note://internal/{name}"),
+            name=f"Note: {name}",
+            description=f"A simple note named {name}",
+            mimeType="text/plain",
+        )
+        for name in notes
+    ]
+    
+    search_resources = [
+        types.Resource(
+            uri=AnyUrl(f"search://result/{name}"),
+            name=f"Search: {name}",
+            description=f"Web search result for query '{name}'",
+            mimeType="text/plain",
+        )
+        for name in search_results
+    ]
+    
+    return note_resources + search_resources
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """
+    Read a specific note or search result's content by its URI.
+    """
+    if uri.scheme == "search":
+        name = uri.path.lstrip("/")
+        if name in search_results:
+            return search_results[name]
+        raise ValueError(f"Search result not found: {name}")
+    
+    raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
+
+# Static prompt list built once; the handler returns the same read-only models
+_PROMPTS = [
+    types.Prompt(
+        name="summarize-search",
+        description="Creates a summary of search results",
+        arguments=[
+            types.PromptArgument(
+                name="style",
+                description="Style of the summary (brief/detailed)",
+                required=False,
+            )
+        ],
+    )
+]
+
+@server.list_prompts()
+async def handle_list_prompts() -> list[types.Prompt]:
+    """
+    List available prompts for notes and search results.
+    """
+    return _PROMPTS
+
+@server.get_prompt()
+async def handle_get_prompt(
+    name: str, arguments: dict[str, str] | None
+) -> types.GetPromptResult:
+    """
+    Generate a prompt by combining arguments with server state.
+    Supports prompts for notes and search results.
+    """
+    # Local bindings skip module/attribute lookups inside the builders
+    GPR = types.GetPromptResult
+    PM = types.PromptMessage
+    TC = types.TextContent
+
+    if name == "summarize-notes":
+        style = (arguments or {}).get("style", "brief")
+        detail_prompt = " Give extensive details." if style == "detailed" else ""
+        d = notes
+
+        return GPR(
+            description="Summarize the current notes",
+            messages=[
+                PM(
+                    role="user",
+                    content=TC(
+                        type="text",
+                        text=f"Here are the current notes to summarize:{detail_prompt}\n\n"
+                        + "\n".join(map(_NOTE_LINE_FMT, d.keys(), d.values())),
+                    ),
+                )
+            ],
+        )
+
+    elif name == "summarize-search":
+        style = (arguments or {}).get("style", "brief")
+        detail_prompt = " Give extensive details." if style == "detailed" else ""
+        d = search_results
+
+        return GPR(
+            description="Summarize the current search results",
+            messages=[
+                PM(
+                    role="user",
+                    content=TC(
+                        type="text",
+                        text=f"Here are the current search results to summarize:{detail_prompt}\n\n"
+                        + "\n".join(map(_NOTE_LINE_FMT, d.keys(), d.values())),
+                    ),
+                )
+            ],
+        )
+
+    raise ValueError(f"Unknown prompt: {name}")
+
+# Static tool list built once at import time
+_TOOLS = [
+    types.Tool(
+        name="web-search",
+        description="Perform a web search using OpenAI's API",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "name": {"type": "string", "description": "Name to save the search result"},
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of search results",
+                    "minimum": 1,
+                    "maximum": 10,
+                    "default": 5
+                }
+            },
+            "required": ["query", "name"]
+        },
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """
+    List available tools, including web search and note management.
+    """
+    return _TOOLS
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, 
+    arguments: Optional[dict]
+) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests for adding notes and web searching.
+    """
+
+    try:
+        if name != "web-search":
+            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+        if not arguments:
+            return _ERR_NO_ARGS
+
+        # Coerce max_results without the try/except in the common cases
+        mr = arguments.get(_K_MAX_RESULTS, 5)
+        if isinstance(mr, int):
+            max_results = mr
+        elif isinstance(mr, str) and mr.isdigit():
+            max_results = int(mr)
+        else:
+            max_results = 5
+
+        # Load configuration off-loop so a cold read never stalls the event loop
+        try:
+            config = await asyncio.to_thread(load_openai_config)
+        except Exception as e:
+            logger.error("Failed to load OpenAI config: %s", e)
+            return [TextContent(type="text", text=f"Configuration error: {str(e)}")]
+
+        # Validate OpenAI configuration
+        openai_api_key = config.get('openai_api_key')
+        if not openai_api_key:
+            return _ERR_NO_API_KEY
+
+        openai_model = config.get('openai_model', 'gpt-3.5-turbo')
+
+        # Validate required arguments
+        query = arguments.get(_K_QUERY)
+        if query is None:
+            return _ERR_NO_QUERY
+        name = arguments.get(_K_NAME)
+        if name is None:
+            return _ERR_NO_NAME
+
+        # Perform web search via the batching layer so concurrent calls
+        # can share a single OpenAI request
+        try:
+            search_content = await _search_web(query, max_results, openai_api_key, openai_model)
+        except ValueError as e:
+            return [TextContent(type="text", text=str(e))]
+
+        # Store search results in the global dictionary
+        global search_results
+        search_results[name] = search_content
+
+        # Notify clients that resources have changed
+        await _notify_resources_changed()
+
+        return [TextContent(
+            type="text",
+            text=f"Saved search results for '{name}': {search_content}"
+        )]
+
+    except Exception as e:
+        logger.error("Error in web search tool: %s", e)
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+# Rest of the existing main function remains the same
+async def main():
+    # Run the server using stdin/stdout streams
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="Scout",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
+                ),
+            )
+    finally:
+        # Close the shared HTTP session on shutdown
+        if _session is not None and not _session.closed:
+            await _session.close()
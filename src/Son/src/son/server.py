@@ -1,383 +1,466 @@
-import asyncio
-import json
-import os
-from typing import Any, Dict, List, Optional
-import requests
-
-from mcp.server.models import InitializationOptions
-import mcp.types as types
-from mcp.server import NotificationOptions, Server
-from pydantic import AnyUrl
-import mcp.server.stdio
-
-from qdrant_client import QdrantClient, models
-from qdrant_client.http import models as rest
-from qdrant_client.models import Distance, VectorParams
-# Store notes as a simple key-value dict to demonstrate state management
-notes: dict[str, str] = {}
-search_results: dict[str, str] = {}  # Store search results
-
-server = Server("Scout")
-
-def get_qdrant_client():
-    return QdrantClient(
-        url="http://localhost:6333",
-        api_key="A1B2C3D4E5"  # Configure with your API key
-    )
-
-def get_collection_list(client) -> List[str]:
-    """Helper function to get list of collections"""
-    try:
-        collections = client.get_collections()
-        return [collection.name for collection in collections.collections]
-    except Exception:
-        return []
-    
-@server.list_resources()
-async def handle_list_resources() -> list[types.Resource]:
-    """
-    List available Qdrant collections as resources.
-    Each collection is exposed as a resource with a custom URI scheme.
-    """
-    client = get_qdrant_client()
-    collections = get_collection_list(client)
-    
-    collection_resources = [
-        types.Resource(
-            uri=AnyUrl(f"qdrant://collection/{name}"),
-            name=f"Collection: {name}",
-            description=f"Qdrant vector collection: {name}",
-            mimeType="application/json",
-        )
-        for name in collections
-    ]
-    
-    return collection_resources
-
-@server.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
-    """
-    Read a specific collection's information by its URI.
-    """
-    if uri.scheme == "qdrant":
-        client = get_qdrant_client()
-        collection_name = uri.path.lstrip("/")
-        
-        try:
-            collection_info = client.get_collection(collection_name)
-            info_dict = {
-                "name": collection_name,
-                "status": str(collection_info.status),
-                "vectors_count": collection_info.vectors_count,
-                "points_count": collection_info.points_count,
-                "segments_count": collection_info.segments_count,
-                "optimizer_status": str(collection_info.optimizer_status),
-                "vector_config": {
-                    "size": collection_info.config.params.vectors.size,
-                    "distance": str(collection_info.config.params.vectors.distance)
-                }
-            }
-            return json.dumps(info_dict, indent=2)
-        except Exception as e:
-            raise ValueError(f"Error reading collection: {str(e)}")
-    
-    raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
-
-@server.list_prompts()
-async def handle_list_prompts() -> list[types.Prompt]:
-    """
-    List available prompts for Qdrant collection management.
-    """
-    return [
-        types.Prompt(
-            name="qdrant-system",
-            description="Manage and analyze Qdrant vector collections",
-            arguments=[
-                types.PromptArgument(
-                    name="action",
-                    description="Action to perform (create/read/delete/analyze)",
-                    required=True,
-                ),
-                types.PromptArgument(
-                    name="collection_name",
-                    description="Name of the collection to work with",
-                    required=True,
-                ),
-                types.PromptArgument(
-                    name="detail_level",
-                    description="Level of detail in analysis (brief/detailed)",
-                    required=False,
-                )
-            ],
-        )
-    ]
-
-@server.get_prompt()
-async def handle_get_prompt(
-    name: str, arguments: dict[str, str] | None
-) -> types.GetPromptResult:
-    """
-    Generate prompts for Qdrant collection management and analysis.
-    """
-    if name == "qdrant-system":
-        if not arguments:
-            raise ValueError("Arguments required for qdrant-system prompt")
-        
-        action = arguments.get("action")
-        collection_name = arguments.get("collection_name")
-        detail_level = arguments.get("detail_level", "brief")
-        
-        if not action or not collection_name:
-            raise ValueError("Action and collection_name are required")
-        
-        client = get_qdrant_client()
-        
-        if action == "analyze":
-            try:
-                collection_info = client.get_collection(collection_name)
-                detail_prompt = " Provide extensive analysis." if detail_level == "detailed" else ""
-                
-                return types.GetPromptResult(
-                    description=f"Analyze Qdrant collection: {collection_name}",
-                    messages=[
-                        types.PromptMessage(
-                            role="user",
-                            content=types.TextContent(
-                                type="text",
-                                text=f"Please analyze this Qdrant collection:{detail_prompt}\n\n"
-                                     f"Collection: {collection_name}\n"
-                                     f"Status: {collection_info.status}\n"
-                                     f"Vectors: {collection_info.vectors_count}\n"
-                                     f"Points: {collection_info.points_count}\n"
-                                     f"Segments: {collection_info.segments_count}\n"
-                                     f"Vector Size: {collection_info.config.params.vectors.size}\n"
-                                     f"Distance: {collection_info.config.params.vectors.distance}"
-                            ),
-                        )
-                    ],
-                )
-            except Exception as e:
-                raise ValueError(f"Error analyzing collection: {str(e)}")
-        
-        return types.GetPromptResult(
-            description=f"Manage Qdrant collection: {collection_name}",
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(
-                        type="text",
-                        text=f"Please help me {action} the Qdrant collection named '{collection_name}'."
-                    ),
-                )
-            ],
-        )
-    
-    raise ValueError(f"Unknown prompt: {name}")
-
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """
-    List available tools for Qdrant vector database management.
-    """
-    return [
-        types.Tool(
-            name="qdrant-write-collection",
-            description="Create a new Qdrant collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_name": {"type": "string"},
-                    "vector_size": {"type": "integer", "minimum": 1, "default": 384},
-                    "distance": {
-                        "type": "string", 
-                        "enum": ["Cosine", "Euclidean", "Dot"],
-                        "default": "Cosine"
-                    }
-                },
-                "required": ["collection_name"]
-            },
-        ),
-        types.Tool(
-            name="qdrant-read-collection",
-            description="Read information about a Qdrant collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_name": {"type": "string"}
-                },
-                "required": ["collection_name"]
-            },
-        ),
-        types.Tool(
-            name="qdrant-delete-collection",
-            description="Delete a Qdrant collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection_name": {"type": "string"}
-                },
-                "required": ["collection_name"]
-            },
-        ),
-        types.Tool(
-            name="qdrant-list-collections",
-            description="List all available Qdrant collections",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            },
-        )
-    ]
-
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """
-    Handle tool execution requests for Qdrant collection management.
-    """
-    client = get_qdrant_client()
-    
-    if name == "qdrant-list-collections":
-        try:
-            collections = client.get_collections()
-            if collections.collections:
-                collection_names = [col.name for col in collections.collections]
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Available collections:\n{', '.join(collection_names)}"
-                    )
-                ]
-            else:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="No collections currently exist."
-                    )
-                ]
-        except Exception as e:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Error listing collections: {str(e)}"
-                )
-            ]
-        
-    elif name == "qdrant-write-collection":
-        collection_name = arguments.get("collection_name")
-        vector_size = arguments.get("vector_size", 384)  # Default to 384 as per your curl example
-        distance = arguments.get("distance", "Cosine")
-
-        if not collection_name:
-            raise ValueError("Collection name is required")
-
-        # Map distance string to Qdrant Distance enum
-        distance_map = {
-            "Cosine": Distance.COSINE,
-            "Euclidean": Distance.EUCLID,
-            "Dot": Distance.DOT
-        }
-
-        try:
-            # Create collection with vector configuration
-            client.create_collection(
-                collection_name=collection_name,
-                vectors_config=models.VectorParams(
-                    size=vector_size,
-                    distance=distance_map.get(distance, Distance.COSINE)
-                )
-            )
-            
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Created collection '{collection_name}' with vector size {vector_size} and {distance} distance"
-                )
-            ]
-        except Exception as e:
-            return [
-                types.TextContent(
-                    type="text", 
-                    text=f"Error creating collection: {str(e)}"
-                )
-            ]
-    
-    elif name == "qdrant-read-collection":
-        collection_name = arguments.get("collection_name")
-        
-        if not collection_name:
-            raise ValueError("Collection name is required")
-
-        try:
-            collection_info = client.get_collection(collection_name)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Collection Details:\n"
-                         f"Name: {collection_name}\n"
-                         f"Status: {collection_info.status}\n"
-                         f"Vectors Count: {collection_info.vectors_count}\n"
-                         f"Points Count: {collection_info.points_count}\n"
-                         f"Segments Count: {collection_info.segments_count}\n"
-                         f"Optimization Status: {collection_info.optimizer_status}\n"
-                         f"Vector Configuration: {collection_info.config.params.vectors}"
-                )
-            ]
-        except Exception as e:
-            return [
-                types.TextContent(
-                    type="text", 
-                    text=f"Error reading collection '{collection_name}': {str(e)}"
-                )
-            ]
-
-    elif name == "qdrant-delete-collection":
-        collection_name = arguments.get("collection_name")
-        
-        if not collection_name:
-            raise ValueError("Collection name is required")
-
-        try:
-            # Check if the collection exists
-            collections = client.get_collections()
-            if collection_name not in [col.name for col in collections.collections]:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Collection '{collection_name}' does not exist. Nothing to delete."
-                    )
-                ]
-
-            client.delete_collection(collection_name)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Successfully deleted collection '{collection_name}'"
-                )
-            ]
-        except Exception as e:
-            return [
-                types.TextContent(
-                    type="text", 
-                    text=f"Error deleting collection '{collection_name}': {str(e)}"
-                )
-            ]
-
-    raise ValueError(f"Unknown tool: {name}")
-
-async def main():
-    # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="Scout",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
\ No newline at end of file
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+import requests
+
+from mcp.server.models import InitializationOptions
+import mcp.types as types
+from mcp.server import NotificationOptions, Server
+from pydantic import AnyUrl
+import mcp.server.stdio
+
+from qdrant_client import AsyncQdrantClient, models
+from qdrant_client.http import models as rest
+from qdrant_client.models import Distance, VectorParams
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode than stdlib
+except ImportError:
+    orjson = None
+# Store notes as a simple key-value dict to demonstrate state management
+notes: dict[str, str] = {}
+search_results: dict[str, str] = {}  # Store search results
+
+server = Server("Scout")
+
+# Interned argument keys so repeated dict lookups reuse the cached hash
+_K_COLLECTION_NAME = sys.intern('collection_name')
+_K_VECTOR_SIZE = sys.intern('vector_size')
+_K_DISTANCE = sys.intern('distance')
+
+# Map distance string to Qdrant Distance enum, built once at import time
+_DISTANCE_MAP = {
+    "Cosine": Distance.COSINE,
+    "Euclidean": Distance.EUCLID,
+    "Dot": Distance.DOT
+}
+
+# Single shared client so handlers reuse one connection instead of paying
+# connect + handshake cost on every request
+_client: Optional[AsyncQdrantClient] = None
+
+def get_qdrant_client():
+    global _client
+    if _client is None:
+        _client = AsyncQdrantClient(
+            url="http://localhost:6333",
+            api_key="A1B2C3D4E5"  # Configure with your API key
+        )
+    return _client
+
+# Short-TTL caches so hot list/read paths skip the HTTP round-trip to Qdrant.
+# The name list is cached alongside a frozenset so membership tests are O(1).
+_CACHE_TTL = 3.0
+_coll_list_cache: Optional[tuple[float, List[str], frozenset]] = None
+_coll_info_cache: Dict[str, tuple[float, Any]] = {}
+
+def _invalidate_collection_caches(collection_name: Optional[str] = None):
+    """Drop cached collection data after a create/delete mutation."""
+    global _coll_list_cache
+    _coll_list_cache = None
+    if collection_name is not None:
+        _coll_info_cache.pop(collection_name, None)
+    else:
+        _coll_info_cache.clear()
+
+async def get_collection_list(client) -> List[str]:
+    """Helper function to get list of collections (cached for a few seconds)"""
+    global _coll_list_cache
+    now = time.monotonic()
+    if _coll_list_cache is not None and now - _coll_list_cache[0] < _CACHE_TTL:
+        return _coll_list_cache[1]
+    # Let fetch failures propagate so callers can distinguish "no
+    # collections" from "Qdrant unreachable"; only successes are cached
+    collections = await client.get_collections()
+    names = [collection.name for collection in collections.collections]
+    _coll_list_cache = (now, names, frozenset(names))
+    return names
+
+async def collection_exists(client, collection_name: str) -> bool:
+    """O(1) membership test against the cached collection names."""
+    await get_collection_list(client)
+    if _coll_list_cache is None:
+        return False
+    return collection_name in _coll_list_cache[2]
+
+async def get_collection_info(client, collection_name: str):
+    """Fetch collection info through the short-TTL cache."""
+    now = time.monotonic()
+    cached = _coll_info_cache.get(collection_name)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+    info = await client.get_collection(collection_name)
+    _coll_info_cache[collection_name] = (now, info)
+    return info
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """
+    List available Qdrant collections as resources.
+    Each collection is exposed as a resource with a custom URI scheme.
+    """
+    client = get_qdrant_client()
+    try:
+        collections = await get_collection_list(client)
+    except Exception:
+        return []
+    
+    collection_resources = [
+        types.Resource(
+            uri=AnyUrl(f"qdrant://collection/{name}"),
+            name=f"Collection: {name}",
+            description=f"Qdrant vector collection: {name}",
+            mimeType="application/json",
+        )
+        for name in collections
+    ]
+    
+    return collection_resources
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """
+    Read a specific collection's information by its URI.
+    """
+    if uri.scheme == "qdrant":
+        client = get_qdrant_client()
+        collection_name = uri.path.lstrip("/")
+        
+        try:
+            collection_info = await get_collection_info(client, collection_name)
+            info_dict = {
+                "name": collection_name,
+                "status": str(collection_info.status),
+                "vectors_count": collection_info.vectors_count,
+                "points_count": collection_info.points_count,
+                "segments_count": collection_info.segments_count,
+                "optimizer_status": str(collection_info.optimizer_status),
+                "vector_config": {
+                    "size": collection_info.config.params.vectors.size,
+                    "distance": str(collection_info.config.params.vectors.distance)
+                }
+            }
+            if orjson is not None:
+                return orjson.dumps(info_dict, option=orjson.OPT_INDENT_2).decode()
+            return json.dumps(info_dict, indent=2)
+        except Exception as e:
+            raise ValueError(f"Error reading collection: {str(e)}")
+    
+    raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
+
+# Static prompt list built once; the handler returns the same read-only models
+_PROMPTS = [
+    types.Prompt(
+        name="qdrant-system",
+        description="Manage and analyze Qdrant vector collections",
+        arguments=[
+            types.PromptArgument(
+                name="action",
+                description="Action to perform (create/read/delete/analyze)",
+                required=True,
+            ),
+            types.PromptArgument(
+                name="collection_name",
+                description="Name of the collection to work with",
+                required=True,
+            ),
+            types.PromptArgument(
+                name="detail_level",
+                description="Level of detail in analysis (brief/detailed)",
+                required=False,
+            )
+        ],
+    )
+]
+
+@server.list_prompts()
+async def handle_list_prompts() -> list[types.Prompt]:
+    """
+    List available prompts for Qdrant collection management.
+    """
+    return _PROMPTS
+
+@server.get_prompt()
+async def handle_get_prompt(
+    name: str, arguments: dict[str, str] | None
+) -> types.GetPromptResult:
+    """
+    Generate prompts for Qdrant collection management and analysis.
+    """
+    if name == "qdrant-system":
+        if not arguments:
+            raise ValueError("Arguments required for qdrant-system prompt")
+        
+        action = arguments.get("action")
+        collection_name = arguments.get(_K_COLLECTION_NAME)
+        detail_level = arguments.get("detail_level", "brief")
+        
+        if not action or not collection_name:
+            raise ValueError("Action and collection_name are required")
+        
+        client = get_qdrant_client()
+        
+        if action == "analyze":
+            try:
+                collection_info = await get_collection_info(client, collection_name)
+                detail_prompt = " Provide extensive analysis." if detail_level == "detailed" else ""
+                
+                return types.GetPromptResult(
+                    description=f"Analyze Qdrant collection: {collection_name}",
+                    messages=[
+                        types.PromptMessage(
+                            role="user",
+                            content=types.TextContent(
+                                type="text",
+                                text=f"Please analyze this Qdrant collection:{detail_prompt}\n\n"
+                                     f"Collection: {collection_name}\n"
+                                     f"Status: {collection_info.status}\n"
+                                     f"Vectors: {collection_info.vectors_count}\n"
+                                     f"Points: {collection_info.points_count}\n"
+                                     f"Segments: {collection_info.segments_count}\n"
+                                     f"Vector Size: {collection_info.config.params.vectors.size}\n"
+                                     f"Distance: {collection_info.config.params.vectors.distance}"
+                            ),
+                        )
+                    ],
+                )
+            except Exception as e:
+                raise ValueError(f"Error analyzing collection: {str(e)}")
+        
+        return types.GetPromptResult(
+            description=f"Manage Qdrant collection: {collection_name}",
+            messages=[
+                types.PromptMessage(
+                    role="user",
+                    content=types.TextContent(
+                        type="text",
+                        text=f"Please help me {action} the Qdrant collection named '{collection_name}'."
+                    ),
+                )
+            ],
+        )
+    
+    raise ValueError(f"Unknown prompt: {name}")
+
+# Static tool list built once at import time
+_TOOLS = [
+    types.Tool(
+        name="qdrant-write-collection",
+        description="Create a new Qdrant collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_name": {"type": "string"},
+                "vector_size": {"type": "integer", "minimum": 1, "default": 384},
+                "distance": {
+                    "type": "string", 
+                    "enum": ["Cosine", "Euclidean", "Dot"],
+                    "default": "Cosine"
+                }
+            },
+            "required": ["collection_name"]
+        },
+    ),
+    types.Tool(
+        name="qdrant-read-collection",
+        description="Read information about a Qdrant collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_name": {"type": "string"}
+            },
+            "required": ["collection_name"]
+        },
+    ),
+    types.Tool(
+        name="qdrant-delete-collection",
+        description="Delete a Qdrant collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection_name": {"type": "string"}
+            },
+            "required": ["collection_name"]
+        },
+    ),
+    types.Tool(
+        name="qdrant-list-collections",
+        description="List all available Qdrant collections",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        },
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    List available tools for Qdrant vector database management.
+    """
+    return _TOOLS
+
+async def _list_collections(client, arguments: dict) -> list[types.TextContent]:
+    try:
+        collection_names = await get_collection_list(client)
+        if collection_names:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Available collections:\n{', '.join(collection_names)}"
+                )
+            ]
+        else:
+            return [
+                types.TextContent(
+                    type="text",
+                    text="No collections currently exist."
+                )
+            ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Error listing collections: {str(e)}"
+            )
+        ]
+
+async def _write_collection(client, arguments: dict) -> list[types.TextContent]:
+    collection_name = arguments.get(_K_COLLECTION_NAME)
+    vector_size = arguments.get(_K_VECTOR_SIZE, 384)  # Default to 384 as per your curl example
+    distance = arguments.get(_K_DISTANCE, "Cosine")
+
+    if not collection_name:
+        raise ValueError("Collection name is required")
+
+    try:
+        # Create collection with vector configuration
+        await client.create_collection(
+            collection_name=collection_name,
+            vectors_config=models.VectorParams(
+                size=vector_size,
+                distance=_DISTANCE_MAP.get(distance, Distance.COSINE)
+            )
+        )
+        _invalidate_collection_caches(collection_name)
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Created collection '{collection_name}' with vector size {vector_size} and {distance} distance"
+            )
+        ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text", 
+                text=f"Error creating collection: {str(e)}"
+            )
+        ]
+
+async def _read_collection(client, arguments: dict) -> list[types.TextContent]:
+    collection_name = arguments.get(_K_COLLECTION_NAME)
+
+    if not collection_name:
+        raise ValueError("Collection name is required")
+
+    try:
+        collection_info = await get_collection_info(client, collection_name)
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Collection Details:\n"
+                     f"Name: {collection_name}\n"
+                     f"Status: {collection_info.status}\n"
+                     f"Vectors Count: {collection_info.vectors_count}\n"
+                     f"Points Count: {collection_info.points_count}\n"
+                     f"Segments Count: {collection_info.segments_count}\n"
+                     f"Optimization Status: {collection_info.optimizer_status}\n"
+                     f"Vector Configuration: {collection_info.config.params.vectors}"
+            )
+        ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text", 
+                text=f"Error reading collection '{collection_name}': {str(e)}"
+            )
+        ]
+
+async def _delete_collection(client, arguments: dict) -> list[types.TextContent]:
+    collection_name = arguments.get(_K_COLLECTION_NAME)
+
+    if not collection_name:
+        raise ValueError("Collection name is required")
+
+    try:
+        # Check if the collection exists
+        if not await collection_exists(client, collection_name):
+            return [
+                types.TextContent(
+                    type="text",
+                    text=f"Collection '{collection_name}' does not exist. Nothing to delete."
+                )
+            ]
+
+        await client.delete_collection(collection_name)
+        _invalidate_collection_caches(collection_name)
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Successfully deleted collection '{collection_name}'"
+            )
+        ]
+    except Exception as e:
+        return [
+            types.TextContent(
+                type="text", 
+                text=f"Error deleting collection '{collection_name}': {str(e)}"
+            )
+        ]
+
+# Tool name -> handler lookup, avoiding the if/elif ladder on every call
+_TOOL_HANDLERS = {
+    "qdrant-list-collections": _list_collections,
+    "qdrant-write-collection": _write_collection,
+    "qdrant-read-collection": _read_collection,
+    "qdrant-delete-collection": _delete_collection,
+}
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests for Qdrant collection management.
+    """
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    client = get_qdrant_client()
+    return await handler(client, arguments or {})
+
+async def main():
+    # Run the server using stdin/stdout streams
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="Scout",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
+                ),
+            )
+    finally:
+        # Close the shared Qdrant client on shutdown
+        if _client is not None:
+            await _client.close()
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""Shared OpenAI helpers for the component generator scripts.
+
+Holds the single async client, the static Echo example prompt, the
+rate limiter, the response cache, and the parsing utilities that were
+previously duplicated across combine_json_python_models.py and test.py.
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import random
+import time
+import httpx
+import openai
+from json.encoder import encode_basestring as _escape_json_string
+from openai import AsyncOpenAI
+import re
+
+#orjson is a C JSON codec; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False)
+
+    def _dumps_bytes(obj):
+        return json.dumps(obj, ensure_ascii=False).encode()
+
+#h2 backs httpx's HTTP/2 support; without it the client construction
+#itself raises, so probe for it like the other optional accelerators
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+#One pooled HTTP/2 transport shared by every completion call, so the
+#async fan-out multiplexes over a single connection instead of paying a
+#TCP+TLS handshake per request (HTTP/2 needs the httpx[http2] extra)
+_http = httpx.AsyncClient(
+    http2=_HTTP2,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
+atexit.register(lambda: asyncio.run(_http.aclose()))
+
+#Shared async client so batched pipelines reuse one connection pool
+_client = AsyncOpenAI(http_client=_http)
+
+#Multi-KB Echo example built once instead of re-concatenated per call
+_ECHO_EXAMPLE = ''' # from langflow.field_typing import Data\nfrom langflow.custom import Component\nfrom langflow.io import MessageTextInput, Output\nfrom langflow.schema import Data\n\n\nclass CustomComponent(Component):\n    display_name = \"Custom Component\"\n    description = \"Use as a template to create your own component.\"\n    documentation: str = \"http://docs.langflow.org/components/custom\"\n    icon = \"code\"\n    name = \"CustomComponent\"\n\n    inputs = [\n        MessageTextInput(\n            name=\"input_value\",\n            display_name=\"Input Value\",\n            info=\"This is a custom component Input\",\n            value=\"Hello, World!\",\n            tool_mode=True,\n        ),\n    ]\n\n    outputs = [\n        Output(display_name=\"Output\", name=\"output\", method=\"build_output\"),\n    ]\n\n    def build_output(self) -> Data:\n        data = Data(value=self.input_value)\n        self.status = data\n        return data\n",   '''
+
+#Static instructions lead as the system prefix so OpenAI's automatic
+#prompt caching can reuse them; only the short dynamic input varies
+_PYTHON_SYSTEM_PROMPT = "Here is an example of a Echo function:" + _ECHO_EXAMPLE
+_JSON_SYSTEM_PROMPT = """Generate a LangFlow component JSON for the python code given by the user. Leave 'value' field empty."""
+
+#Throttling so batch sweeps stay under the account's rate-limit tier
+MAX_RPM = int(os.environ.get("OPENAI_MAX_RPM", 500))
+MAX_TPM = int(os.environ.get("OPENAI_MAX_TPM", 200000))
+MAX_ATTEMPTS = 5
+CACHE_DIR = ".llm_cache"
+
+#Pattern compiled once; calling the bound methods skips the re-module
+#cache lookup on every invocation
+_PY_BLOCK_RE = re.compile(r"```python\n(.*?)\n```", re.DOTALL)
+
+class _RateLimiter:
+    """Token buckets metering requests-per-minute and tokens-per-minute."""
+    def __init__(self, max_rpm, max_tpm):
+        self.max_rpm = max_rpm
+        self.max_tpm = max_tpm
+        self.request_budget = float(max_rpm)
+        self.token_budget = float(max_tpm)
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.last_refill
+                self.last_refill = now
+                self.request_budget = min(
+                    self.max_rpm, self.request_budget + self.max_rpm * elapsed / 60.0)
+                self.token_budget = min(
+                    self.max_tpm, self.token_budget + self.max_tpm * elapsed / 60.0)
+                if self.request_budget >= 1 and self.token_budget >= tokens:
+                    self.request_budget -= 1
+                    self.token_budget -= tokens
+                    return
+                await asyncio.sleep(1.0)
+
+_limiter = _RateLimiter(MAX_RPM, MAX_TPM)
+
+async def _create_completion(model, messages):
+    """Rate-limited completion call with exponential backoff + jitter on 429s."""
+    #Rough token estimate: ~4 chars per token plus completion headroom
+    est_tokens = sum(len(m["content"]) for m in messages) // 4 + 500
+    delay = 1.0
+    for attempt in range(MAX_ATTEMPTS):
+        await _limiter.acquire(est_tokens)
+        try:
+            return await _client.chat.completions.create(model=model, messages=messages)
+        except (openai.RateLimitError, openai.APIConnectionError):
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(delay + random.random())
+            delay *= 2
+
+def _cache_key(model, messages):
+    #The dict is built with a fixed key order, so no sort_keys is needed
+    return hashlib.sha256(_dumps_bytes({"m": model, "p": messages})).hexdigest()
+
+async def _cached_completion(model, messages):
+    """Content-addressed cache in front of the API: identical prompts are
+    answered from disk without paying latency or tokens again."""
+    key = _cache_key(model, messages)
+    path = os.path.join(CACHE_DIR, key + ".json")
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return _loads(f.read())["content"]
+
+    response = await _create_completion(model=model, messages=messages)
+    content = response.choices[0].message.content
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_dumps_bytes({"content": content}))
+    return content
+
+async def call_python_model(prompt):
+    #Test Python JSONL
+    content = await _cached_completion(
+        model="ft:gpt-4o-mini-2024-07-18:personal::B2BEJt6D",
+        messages=[
+            {"role": "system", "content": _PYTHON_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    )
+
+    #print(content)
+
+    return content
+
+async def stream_python_model(prompt):
+    """Stream the python-model completion and return the fenced code block
+    as soon as the closing fence arrives, instead of waiting for the full
+    completion before the json stage can start."""
+    est_tokens = (len(_PYTHON_SYSTEM_PROMPT) + len(prompt)) // 4 + 500
+    await _limiter.acquire(est_tokens)
+    stream = await _client.chat.completions.create(
+        model="ft:gpt-4o-mini-2024-07-18:personal::B2BEJt6D",
+        messages=[
+            {"role": "system", "content": _PYTHON_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        stream=True
+    )
+    parts = []
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            continue
+        parts.append(delta)
+        if "\n```" in delta or delta.startswith("`"):
+            parsed = parse_python_code("".join(parts))
+            if parsed is not None:
+                #The tail of the completion is unused; stop consuming it
+                await stream.close()
+                return parsed
+    return parse_python_code("".join(parts))
+
+def get_last_sentence(text):
+    #Scan from the end for the last sentence boundary instead of splitting
+    #the whole prompt; user descriptions end with a period, so the common
+    #case is a few C-level rfind calls
+    t = text.strip()
+    i = max(t.rfind('. '), t.rfind('? '), t.rfind('! '))
+    return t[i + 2:] if i >= 0 else t
+
+def parse_python_code(python_code):
+    #Fast path: the fences are fixed literals, so two C-level finds beat
+    #running the regex engine over the whole response
+    i = python_code.find("```python\n")
+    if i >= 0:
+        i += 10
+        j = python_code.find("\n```", i)
+        if j >= 0:
+            return python_code[i:j]
+    #Fallback for unusual fence variants the model may emit
+    match = _PY_BLOCK_RE.search(python_code)
+    return match.group(1) if match else None
+
+#Prepare python data to JSONL
+def convert_python_one_line(python_code):
+    if python_code is None:
+        #parse_python_code found no fenced block; fail with a clear message
+        #instead of the C escaper's bare TypeError
+        raise ValueError("model reply contained no fenced python code block")
+    #The C string escaper does the same job as json.dumps on a lone string
+    #without building the full encoder
+    return _escape_json_string(python_code)
+
@@ -1,99 +1,184 @@
-import json
-from openai import OpenAI
-import re
-
-false = False  
-true = True   
-
-def call_python_model(prompt):
-    #Test Python JSONL
-    from openai import OpenAI
-
-    client = OpenAI()
-
-    prompt += " Here is an example of a Echo function:"
-    prompt += ''' # from langflow.field_typing import Data\nfrom langflow.custom import Component\nfrom langflow.io import MessageTextInput, Output\nfrom langflow.schema import Data\n\n\nclass CustomComponent(Component):\n    display_name = \"Custom Component\"\n    description = \"Use as a template to create your own component.\"\n    documentation: str = \"http://docs.langflow.org/components/custom\"\n    icon = \"code\"\n    name = \"CustomComponent\"\n\n    inputs = [\n        MessageTextInput(\n            name=\"input_value\",\n            display_name=\"Input Value\",\n            info=\"This is a custom component Input\",\n            value=\"Hello, World!\",\n            tool_mode=True,\n        ),\n    ]\n\n    outputs = [\n        Output(display_name=\"Output\", name=\"output\", method=\"build_output\"),\n    ]\n\n    def build_output(self) -> Data:\n        data = Data(value=self.input_value)\n        self.status = data\n        return data\n",   '''            
-    
-    response = client.chat.completions.create(
-        model="ft:gpt-4o-mini-2024-07-18:personal::B2BEJt6D",
-        messages=[{"role": "user", "content": prompt}]
-    )
-
-    #print(response.choices[0].message.content)
-
-    return response.choices[0].message.content
-
-def get_last_sentence(text):
-    sentences = re.split(r"(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?)\s", text.strip())
-    return sentences[-1] if sentences else None
-
-def parse_python_code(python_code):
-    match = re.search(r"```python\n(.*?)\n```", python_code, re.DOTALL)
-    return match.group(1) if match else None
-
-#Prepare python data to JSONL
-def convert_python_one_line(python_code):
-    jsonl_line = json.dumps(python_code, ensure_ascii=False)
-    #print(jsonl_line)
-    return jsonl_line
-
-def call_json_model(json_data,input_output_data):
-
-    client = OpenAI()
-    prompt = '''Generate a LangFlow component JSON for '''
-    prompt += f"{json_data}."
-    prompt += input_output_data
-    prompt += ''' Leave 'value' field empty.'''
-
-    response = client.chat.completions.create(
-        model="ft:gpt-4o-mini-2024-07-18:personal::B2YQNexS",
-        messages=[{"role": "user", "content": prompt}]
-    )
-    save_json_safely(response.choices[0].message.content)
-    return response.choices[0].message.content
-
-def save_json_safely(content):
-    try:
-        # If the content is already a valid JSON object, save it directly
-        if isinstance(content, dict):
-            json_obj = content
-        else:
-            # Parse the content as JSON
-            json_obj = json.loads(content)
-        
-        # Save with proper formatting
-        with open('test.json', 'w', encoding='utf-8') as f:
-            # Use ensure_ascii=False to properly handle unicode characters
-            # Use separators to remove extra whitespace
-            json.dump(json_obj, f, ensure_ascii=False, separators=(',', ':'))
-            
-        # Verify the saved file can be read back
-        with open('test.json', 'r', encoding='utf-8') as f:
-            verification = json.load(f)
-            
-        return True
-            
-    except Exception as e:
-        print(f"Error: {e}")
-        return False
-
-if __name__ == "__main__":
-    #Generate code from user description
-
-    """Sample user input
-    Generate a LangFlow custom component in python code that multiplies 2 numbers. 
-    The component should have 2 Message inputs and 1 Message output.
-    """
-
-    #user_input = input("Please give detailed description of Langflow custom component:")
-    user_input = "Generate a LangFlow custom component in python code that Echoes the user input. The component should have 1 Message input and 1 Message output."
-    python_code = call_python_model(user_input)
-    input_output_data = get_last_sentence(user_input)
-    #print(python_code)
-    
-    #Find python code from generated responce, convert python into 1 line jsonl string
-    python_code_one_line = convert_python_one_line(parse_python_code(python_code))
-    #print(python_code_one_line)
-
-    #Give json generator prompt to json generator
-    json_responce = call_json_model(python_code_one_line,input_output_data)
+import asyncio
+import os
+
+from _llm_utils import (
+    _cached_completion,
+    _client,
+    _dumps,
+    _dumps_bytes,
+    _loads,
+    _JSON_SYSTEM_PROMPT,
+    _PYTHON_SYSTEM_PROMPT,
+    call_python_model,
+    convert_python_one_line,
+    get_last_sentence,
+    parse_python_code,
+    stream_python_model,
+)
+
+SCRATCH_PATH = "llm_results.jsonl"
+
+#Bound format method: one allocation per prompt instead of an += chain
+_JSON_PROMPT_FMT = "{}.{}".format
+
+def _record_result(user_input, response):
+    """Append a finished pipeline result to the scratch JSONL so partial
+    failures during a batch sweep don't lose completed work."""
+    with open(SCRATCH_PATH, 'a', encoding='utf-8') as f:
+        f.write(_dumps({"input": user_input, "response": response}) + "\n")
+
+async def call_json_model(json_data,input_output_data):
+
+    prompt = _JSON_PROMPT_FMT(json_data, input_output_data)
+
+    content = await _cached_completion(
+        model="ft:gpt-4o-mini-2024-07-18:personal::B2YQNexS",
+        messages=[
+            {"role": "system", "content": _JSON_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    )
+    save_json_safely(content)
+    return content
+
+def save_json_safely(content):
+    try:
+        if isinstance(content, str):
+            # Validate once, then write the original bytes as-is instead of
+            # re-serializing what is already valid JSON
+            _loads(content)
+            payload = content.encode('utf-8')
+        else:
+            # orjson emits compact UTF-8 bytes directly, so the file write
+            # needs no re-encoding pass
+            payload = _dumps_bytes(content)
+
+        # Write to a temp file then rename so concurrent batch runs never
+        # see a partially written test.json
+        tmp = 'test.json.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, 'test.json')
+
+        return True
+
+    except Exception as e:
+        print(f"Error: {e}")
+        return False
+
+async def generate(user_input):
+    """Run the python -> json pipeline for one component description."""
+    parsed_code = await stream_python_model(user_input)
+    input_output_data = get_last_sentence(user_input)
+
+    #Convert python into 1 line jsonl string
+    python_code_one_line = convert_python_one_line(parsed_code)
+
+    #Give json generator prompt to json generator
+    json_response = await call_json_model(python_code_one_line, input_output_data)
+    _record_result(user_input, json_response)
+    return json_response
+
+async def generate_many(user_inputs):
+    """Fan out several descriptions concurrently with asyncio.gather."""
+    return await asyncio.gather(*[generate(user_input) for user_input in user_inputs])
+
+def _batch_line(custom_id, model, messages):
+    return _dumps({
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {"model": model, "messages": messages},
+    })
+
+async def _run_batch(lines):
+    """Upload a JSONL of chat requests as one Batch API job, poll until it
+    finishes, and return {custom_id: completion content}."""
+    upload = await _client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode('utf-8')),
+        purpose="batch",
+    )
+    batch = await _client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        await asyncio.sleep(30)
+        batch = await _client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+    output = await _client.files.content(batch.output_file_id)
+    results = {}
+    for line in output.text.splitlines():
+        if line:
+            entry = _loads(line)
+            results[entry["custom_id"]] = (
+                entry["response"]["body"]["choices"][0]["message"]["content"])
+    return results
+
+async def submit_batch(user_inputs):
+    """Run many description -> component-JSON jobs through the Batch API.
+
+    Offline sweeps don't need real-time answers: batched completions cost
+    half as much and bypass per-minute rate limits. The python stage runs
+    as one batch, then the json stage as a follow-up batch keyed by the
+    same indices."""
+    py_lines = [
+        _batch_line(
+            f"py-{i}",
+            "ft:gpt-4o-mini-2024-07-18:personal::B2BEJt6D",
+            [
+                {"role": "system", "content": _PYTHON_SYSTEM_PROMPT},
+                {"role": "user", "content": user_input}
+            ],
+        )
+        for i, user_input in enumerate(user_inputs)
+    ]
+    py_results = await _run_batch(py_lines)
+
+    json_lines = []
+    unparsed = set()
+    for i, user_input in enumerate(user_inputs):
+        parsed_code = parse_python_code(py_results[f"py-{i}"])
+        if parsed_code is None:
+            #One unfenced completion shouldn't sink the sweep after the
+            #python-stage batch has already been paid for; record the
+            #failure and keep the rest of the entries going
+            unparsed.add(i)
+            _record_result(user_input, None)
+            continue
+        python_code_one_line = convert_python_one_line(parsed_code)
+        prompt = _JSON_PROMPT_FMT(python_code_one_line, get_last_sentence(user_input))
+        json_lines.append(_batch_line(
+            f"json-{i}",
+            "ft:gpt-4o-mini-2024-07-18:personal::B2YQNexS",
+            [
+                {"role": "system", "content": _JSON_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+        ))
+    json_results = await _run_batch(json_lines) if json_lines else {}
+
+    responses = []
+    for i, user_input in enumerate(user_inputs):
+        if i in unparsed:
+            responses.append(None)
+            continue
+        response = json_results[f"json-{i}"]
+        _record_result(user_input, response)
+        responses.append(response)
+    return responses
+
+if __name__ == "__main__":
+    #Generate code from user description
+
+    """Sample user input
+    Generate a LangFlow custom component in python code that multiplies 2 numbers. 
+    The component should have 2 Message inputs and 1 Message output.
+    """
+
+    #user_input = input("Please give detailed description of Langflow custom component:")
+    user_input = "Generate a LangFlow custom component in python code that Echoes the user input. The component should have 1 Message input and 1 Message output."
+    json_responce = asyncio.run(generate(user_input))
@@ -1,342 +1,567 @@
-import asyncio
-import os
-import random
-
-from youtube_transcript_api import YouTubeTranscriptApi
-
-from mcp.server.models import InitializationOptions
-import mcp.types as types
-from mcp.server import NotificationOptions, Server
-from pydantic import AnyUrl
-import mcp.server.stdio
-
-# Store notes as a simple key-value dict to demonstrate state management
-notes: dict[str, str] = {}
-
-server = Server("notes")
-
-@server.list_resources()
-async def handle_list_resources() -> list[types.Resource]:
-    """
-    List available note resources.
-    Each note is exposed as a resource with a custom note:// URI scheme.
-    """
-    return [
-        types.Resource(
-            uri=AnyUrl(f"note://internal/{name}"),
-            name=f"Note: {name}",
-            description=f"A simple note named {name}",
-            mimeType="text/plain",
-        )
-        for name in notes
-    ]
-
-@server.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
-    """
-    Read a specific note's content by its URI.
-    The note name is extracted from the URI host component.
-    """
-    if uri.scheme != "note":
-        raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
-
-    name = uri.path
-    if name is not None:
-        name = name.lstrip("/")
-        return notes[name]
-    raise ValueError(f"Note not found: {name}")
-
-@server.list_prompts()
-async def handle_list_prompts() -> list[types.Prompt]:
-    """
-    List available prompts.
-    Each prompt can have optional arguments to customize its behavior.
-    """
-    return [
-        types.Prompt(
-            name="summarize-notes",
-            description="Creates a summary of all notes",
-            arguments=[
-                types.PromptArgument(
-                    name="style",
-                    description="Style of the summary (brief/detailed)",
-                    required=False,
-                )
-            ],
-        )
-    ]
-
-@server.get_prompt()
-async def handle_get_prompt(
-    name: str, arguments: dict[str, str] | None
-) -> types.GetPromptResult:
-    """
-    Generate a prompt by combining arguments with server state.
-    The prompt includes all current notes and can be customized via arguments.
-    """
-    if name != "summarize-notes":
-        raise ValueError(f"Unknown prompt: {name}")
-
-    style = (arguments or {}).get("style", "brief")
-    detail_prompt = " Give extensive details." if style == "detailed" else ""
-
-    return types.GetPromptResult(
-        description="Summarize the current notes",
-        messages=[
-            types.PromptMessage(
-                role="user",
-                content=types.TextContent(
-                    type="text",
-                    text=f"Here are the current notes to summarize:{detail_prompt}\n\n"
-                    + "\n".join(
-                        f"- {name}: {content}"
-                        for name, content in notes.items()
-                    ),
-                ),
-            )
-        ],
-    )
-
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """
-    List available tools.
-    Each tool specifies its arguments using JSON Schema validation.
-    """
-    return [
-        types.Tool(
-            name="add-note",
-            description="Add a new note",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "content": {"type": "string"},
-                },
-                "required": ["name", "content"],
-            },
-        ),
-        types.Tool(
-            name="randomize-note",
-            description="Create a randomized version of an existing note",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note_name": {"type": "string"},
-                    "randomization_type": {
-                        "type": "string",
-                        "enum": ["shuffle", "reverse", "uppercase", "lowercase"]
-                    },
-                },
-                "required": ["note_name", "randomization_type"],
-            },
-        ),
-        types.Tool(
-            name="word-count",
-            description="Count the number of words in a note",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note_name": {"type": "string"},
-                },
-                "required": ["note_name"],
-            },
-        ),
-        types.Tool(
-            name="tag-note",
-            description="Add tags to an existing note",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "note_name": {"type": "string"},
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                },
-                "required": ["note_name", "tags"],
-            },
-        ),
-        types.Tool(
-            name="get-youtube-transcript",
-            description="Fetch transcript for a YouTube video",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {"type": "string"},
-                    "language": {
-                        "type": "string", 
-                        "description": "Optional language code (e.g., 'en')"
-                    }
-                },
-                "required": ["video_id"],
-            },
-        )
-    ]
-
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: dict | None
-) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
-    """
-    Handle tool execution requests.
-    Tools can modify server state and notify clients of changes.
-    """
-    if name == "add-note":
-        if not arguments:
-            raise ValueError("Missing arguments")
-
-        note_name = arguments.get("name")
-        content = arguments.get("content")
-
-        if not note_name or not content:
-            raise ValueError("Missing name or content")
-
-        # Update server state
-        notes[note_name] = content
-
-        # Notify clients that resources have changed
-        await server.request_context.session.send_resource_list_changed()
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Added note '{note_name}' with content: {content}",
-            )
-        ]
-    
-    elif name == "randomize-note":
-        if not arguments:
-            raise ValueError("Missing arguments")
-        
-        note_name = arguments.get("note_name")
-        randomization_type = arguments.get("randomization_type")
-
-        if not note_name or note_name not in notes:
-            raise ValueError(f"Note '{note_name}' not found")
-
-        content = notes[note_name]
-        randomized_content = content
-
-        if randomization_type == "shuffle":
-            words = content.split()
-            random.shuffle(words)
-            randomized_content = " ".join(words)
-        elif randomization_type == "reverse":
-            randomized_content = content[::-1]
-        elif randomization_type == "uppercase":
-            randomized_content = content.upper()
-        elif randomization_type == "lowercase":
-            randomized_content = content.lower()
-        
-        # Create a new note with randomized content
-        randomized_note_name = f"{note_name}_randomized_{randomization_type}"
-        notes[randomized_note_name] = randomized_content
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Randomized note '{note_name}' using {randomization_type}. New note: {randomized_note_name}"
-            )
-        ]
-    
-    elif name == "word-count":
-        if not arguments:
-            raise ValueError("Missing arguments")
-        
-        note_name = arguments.get("note_name")
-
-        if not note_name or note_name not in notes:
-            raise ValueError(f"Note '{note_name}' not found")
-
-        content = notes[note_name]
-        word_count = len(content.split())
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Word count for note '{note_name}': {word_count} words"
-            )
-        ]
-    
-    elif name == "tag-note":
-        if not arguments:
-            raise ValueError("Missing arguments")
-        
-        note_name = arguments.get("note_name")
-        tags = arguments.get("tags", [])
-
-        if not note_name or note_name not in notes:
-            raise ValueError(f"Note '{note_name}' not found")
-
-        # Store tags as a separate metadata (in this simple implementation, we'll append to the note)
-        notes[note_name] = f"[TAGS: {', '.join(tags)}]\n{notes[note_name]}"
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Added tags {tags} to note '{note_name}'"
-            )
-        ]
-    
-    elif name == "get-youtube-transcript":
-        if not arguments:
-            raise ValueError("Missing arguments")
-        
-        video_id = arguments.get("video_id")
-        language = arguments.get("language", None)
-
-        if not video_id:
-            raise ValueError("Video ID is required")
-
-        try:
-            # Fetch the transcript
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-            
-            # If language is specified, try to get that specific transcript
-            if language:
-                transcript = transcript_list.find_transcript([language])
-            else:
-                # Otherwise, get the generated transcript
-                transcript = transcript_list.find_generated_transcript(['en'])
-            
-            # Extract the transcript text
-            transcript_text = " ".join([entry['text'] for entry in transcript.fetch()])
-
-            # Add the transcript as a note for persistence
-            note_name = f"transcript_{video_id}"
-            notes[note_name] = transcript_text
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Transcript fetched for video {video_id}. Saved as note '{note_name}'. First 500 characters: {transcript_text[:500]}..."
-                )
-            ]
-        except Exception as e:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Error fetching transcript: {str(e)}"
-                )
-            ]
-
-async def main():
-    # Run the server using stdin/stdout streams
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="notes",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
-
-# If running the script directly
-if __name__ == "__main__":
+import asyncio
+import io
+import os
+import random
+import re
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from operator import itemgetter
+
+# numpy's C permutation beats pure-Python Fisher-Yates on long word lists;
+# shuffle falls back to random.shuffle when it isn't installed
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_rng = _np.random.default_rng() if _np is not None else None
+
+# Below this many words the numpy round-trip costs more than it saves
+_NP_SHUFFLE_MIN = 1000
+
+from mcp.server.models import InitializationOptions
+import mcp.types as types
+from mcp.server import NotificationOptions, Server
+from pydantic import AnyUrl
+import mcp.server.stdio
+
+class _CompressedNote:
+    """A note body held zlib-compressed and decompressed on read.
+
+    Transcripts are repetitive spoken English that shrinks ~3-4x, so a
+    long-running server caching dozens of them keeps a fraction of the
+    RSS; level-1 compression is trivial next to the network fetch.
+    """
+    __slots__ = ("_z",)
+
+    def __init__(self, text: str):
+        self._z = zlib.compress(text.encode(), 1)
+
+    def __str__(self) -> str:
+        return zlib.decompress(self._z).decode()
+
+# Bodies smaller than this aren't worth the compress/decompress round-trip
+_COMPRESS_MIN = 4096
+
+# Store notes as a simple key-value dict to demonstrate state management
+notes: dict[str, "str | _CompressedNote"] = {}
+
+# Tags live beside the content rather than prepended to it, so tagging a
+# large note is a list append instead of a full-body string rebuild
+note_tags: dict[str, list[str]] = {}
+
+def _note_with_tags(name: str, content: str) -> str:
+    """Render a note's content with its tag header, if any, on read."""
+    tags = note_tags.get(name)
+    if tags:
+        return f"[TAGS: {', '.join(tags)}]\n{content}"
+    return content
+
+# Recently fetched transcripts keyed by (video_id, language), with a TTL
+# so repeat queries skip the network and an LRU cap to bound memory
+_TRANSCRIPT_TTL = 3600.0
+_TRANSCRIPT_CACHE_MAX = 256
+_transcript_cache: OrderedDict[tuple[str, str | None], tuple[float, str]] = OrderedDict()
+
+def _cached_transcript(video_id: str, language: str | None) -> str | None:
+    key = (video_id, language)
+    entry = _transcript_cache.get(key)
+    if entry is not None:
+        ts, text = entry
+        if time.monotonic() - ts < _TRANSCRIPT_TTL:
+            _transcript_cache.move_to_end(key)
+            return text
+        del _transcript_cache[key]
+    return None
+
+def _store_transcript(video_id: str, language: str | None, text: str) -> None:
+    _transcript_cache[(video_id, language)] = (time.monotonic(), text)
+    while len(_transcript_cache) > _TRANSCRIPT_CACHE_MAX:
+        _transcript_cache.popitem(last=False)
+
+def _fetch_transcript(video_id: str, language: str | None) -> str:
+    """Fetch and join a video transcript. Blocking; run via asyncio.to_thread."""
+    # Imported on first use: the transcript stack drags in requests/urllib3
+    # and HTML parsing, which non-YouTube workloads never need at startup
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+
+    # If language is specified, try to get that specific transcript
+    if language:
+        transcript = transcript_list.find_transcript([language])
+    else:
+        # Otherwise, get the generated transcript
+        transcript = transcript_list.find_generated_transcript(['en'])
+
+    # Extract the transcript text; map+itemgetter feeds join without
+    # materializing an intermediate list of entry strings
+    return " ".join(map(itemgetter('text'), transcript.fetch()))
+
+# Counting matches instead of len(content.split()) skips allocating a
+# list of every word just to measure it
+_WORD_RE = re.compile(r"\S+")
+
+# Word counts memoized per note. The cached content reference is compared
+# by identity, so overwriting a note naturally misses and recounts — no
+# invalidation hooks needed, and the cache stays bounded by the note count
+_wc_cache: dict[str, tuple[str, int]] = {}
+
+# One lock per note name so read-modify-write sequences stay atomic when
+# handlers run concurrently, while tools touching different notes (e.g.
+# parallel transcript fetches) proceed in parallel
+_note_locks: dict[str, asyncio.Lock] = {}
+
+def _note_lock(name: str) -> asyncio.Lock:
+    return _note_locks.setdefault(name, asyncio.Lock())
+
+server = Server("notes")
+
+# Debounced resource-list-changed notification: a burst of mutations
+# (e.g. a scripted import of many notes) produces one stdio JSON-RPC
+# message after the window instead of one per note
+_NOTIFY_DEBOUNCE = 0.05
+_notify_task: asyncio.Task | None = None
+
+async def _notify_after(session) -> None:
+    global _notify_task
+    await asyncio.sleep(_NOTIFY_DEBOUNCE)
+    _notify_task = None
+    await session.send_resource_list_changed()
+
+def _schedule_notify() -> None:
+    global _notify_task
+    if _notify_task is None or _notify_task.done():
+        session = server.request_context.session
+        _notify_task = asyncio.create_task(_notify_after(session))
+
+# Resource list maintained incrementally: adds append one entry instead
+# of forcing an O(N) rebuild (N pydantic validations) on the next
+# resources/list poll
+_resources_cache: list[types.Resource] | None = None
+
+def _note_added(name: str) -> None:
+    # Notes are never deleted, so comparing lengths tells an overwrite
+    # (listing unchanged) apart from a brand-new name
+    if _resources_cache is not None and len(_resources_cache) != len(notes):
+        _resources_cache.append(
+            types.Resource(
+                uri=AnyUrl(f"note://internal/{name}"),
+                name=f"Note: {name}",
+                description=f"A simple note named {name}",
+                mimeType="text/plain",
+            )
+        )
+
+@server.list_resources()
+async def handle_list_resources() -> list[types.Resource]:
+    """
+    List available note resources.
+    Each note is exposed as a resource with a custom note:// URI scheme.
+    """
+    global _resources_cache
+    if _resources_cache is None:
+        _resources_cache = [
+            types.Resource(
+                uri=AnyUrl(f"note://internal/{name}"),
+                name=f"Note: {name}",
+                description=f"A simple note named {name}",
+                mimeType="text/plain",
+            )
+            for name in notes
+        ]
+    return _resources_cache
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """
+    Read a specific note's content by its URI.
+    The note name is extracted from the URI host component.
+    """
+    if uri.scheme != "note":
+        raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
+
+    name = uri.path
+    if name is not None:
+        # Note names are interned at insertion, so interning the parsed
+        # name lets the dict lookup short-circuit on pointer equality
+        name = sys.intern(name.lstrip("/"))
+        return _note_with_tags(name, str(notes[name]))
+    raise ValueError(f"Note not found: {name}")
+
+# Static prompt and tool declarations validated once at import instead
+# of on every list request
+_PROMPTS = [
+    types.Prompt(
+        name="summarize-notes",
+        description="Creates a summary of all notes",
+        arguments=[
+            types.PromptArgument(
+                name="style",
+                description="Style of the summary (brief/detailed)",
+                required=False,
+            )
+        ],
+    )
+]
+
+@server.list_prompts()
+async def handle_list_prompts() -> list[types.Prompt]:
+    """
+    List available prompts.
+    Each prompt can have optional arguments to customize its behavior.
+    """
+    return _PROMPTS
+
+# Only two header variants exist, so both are built once up front
+_HDR_BRIEF = "Here are the current notes to summarize:\n\n"
+_HDR_DETAIL = "Here are the current notes to summarize: Give extensive details.\n\n"
+
+@server.get_prompt()
+async def handle_get_prompt(
+    name: str, arguments: dict[str, str] | None
+) -> types.GetPromptResult:
+    """
+    Generate a prompt by combining arguments with server state.
+    The prompt includes all current notes and can be customized via arguments.
+    """
+    if name != "summarize-notes":
+        raise ValueError(f"Unknown prompt: {name}")
+
+    style = (arguments or {}).get("style", "brief")
+
+    # Write the prompt into one growing buffer; per-note f-strings would
+    # copy each (potentially MB-sized) transcript before the final join
+    buf = io.StringIO()
+    buf.write(_HDR_DETAIL if style == "detailed" else _HDR_BRIEF)
+    first = True
+    for name, content in notes.items():
+        if not first:
+            buf.write("\n")
+        first = False
+        buf.write("- ")
+        buf.write(name)
+        buf.write(": ")
+        tags = note_tags.get(name)
+        if tags:
+            buf.write("[TAGS: ")
+            buf.write(", ".join(tags))
+            buf.write("]\n")
+        buf.write(str(content))
+
+    return types.GetPromptResult(
+        description="Summarize the current notes",
+        messages=[
+            types.PromptMessage(
+                role="user",
+                content=types.TextContent(
+                    type="text",
+                    text=buf.getvalue(),
+                ),
+            )
+        ],
+    )
+
+_TOOLS = [
+    types.Tool(
+        name="add-note",
+        description="Add a new note",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "content": {"type": "string"},
+            },
+            "required": ["name", "content"],
+        },
+    ),
+    types.Tool(
+        name="randomize-note",
+        description="Create a randomized version of an existing note",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_name": {"type": "string"},
+                "randomization_type": {
+                    "type": "string",
+                    "enum": ["shuffle", "reverse", "uppercase", "lowercase"]
+                },
+            },
+            "required": ["note_name", "randomization_type"],
+        },
+    ),
+    types.Tool(
+        name="word-count",
+        description="Count the number of words in a note",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_name": {"type": "string"},
+            },
+            "required": ["note_name"],
+        },
+    ),
+    types.Tool(
+        name="tag-note",
+        description="Add tags to an existing note",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "note_name": {"type": "string"},
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                },
+            },
+            "required": ["note_name", "tags"],
+        },
+    ),
+    types.Tool(
+        name="get-youtube-transcript",
+        description="Fetch transcript for a YouTube video",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "oneOf": [
+                        {"type": "string"},
+                        {"type": "array", "items": {"type": "string"}}
+                    ],
+                    "description": "A video ID, or a list of IDs fetched concurrently"
+                },
+                "language": {
+                    "type": "string", 
+                    "description": "Optional language code (e.g., 'en')"
+                }
+            },
+            "required": ["video_id"],
+        },
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """
+    List available tools.
+    Each tool specifies its arguments using JSON Schema validation.
+    """
+    return _TOOLS
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: dict | None
+) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+    """
+    Handle tool execution requests.
+    Tools can modify server state and notify clients of changes.
+    """
+    if name == "add-note":
+        if not arguments:
+            raise ValueError("Missing arguments")
+
+        note_name = arguments.get("name")
+        content = arguments.get("content")
+
+        if not note_name or not content:
+            raise ValueError("Missing name or content")
+
+        # Update server state
+        note_name = sys.intern(note_name)
+        async with _note_lock(note_name):
+            notes[note_name] = content
+            _note_added(note_name)
+
+        # Notify clients that resources have changed
+        _schedule_notify()
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Added note '{note_name}' with content: {content}",
+            )
+        ]
+    
+    elif name == "randomize-note":
+        if not arguments:
+            raise ValueError("Missing arguments")
+        
+        note_name = arguments.get("note_name")
+        randomization_type = arguments.get("randomization_type")
+
+        # One dict probe covers both the existence check and the fetch
+        content = notes.get(note_name)
+        if content is None:
+            raise ValueError(f"Note '{note_name}' not found")
+        if not isinstance(content, str):
+            content = str(content)
+
+        # Release local references to the (potentially multi-MB) source
+        # string and intermediates as soon as they're consumed, so only
+        # the copy still held in `notes` stays resident
+        if randomization_type == "shuffle":
+            words = content.split()
+            del content
+            if _rng is not None and len(words) > _NP_SHUFFLE_MIN:
+                words = [words[i] for i in _rng.permutation(len(words))]
+            else:
+                random.shuffle(words)
+            randomized_content = " ".join(words)
+            del words
+        elif randomization_type == "reverse":
+            # ASCII content (typical for English transcripts) reverses as a
+            # raw byte slice instead of walking code points
+            if content.isascii():
+                randomized_content = content.encode('ascii')[::-1].decode('ascii')
+            else:
+                randomized_content = content[::-1]
+            del content
+        elif randomization_type == "uppercase":
+            randomized_content = content.upper()
+            del content
+        elif randomization_type == "lowercase":
+            randomized_content = content.lower()
+            del content
+        else:
+            randomized_content = content
+
+
+        # Create a new note with randomized content
+        randomized_note_name = sys.intern(f"{note_name}_randomized_{randomization_type}")
+        async with _note_lock(randomized_note_name):
+            notes[randomized_note_name] = randomized_content
+            _note_added(randomized_note_name)
+        _schedule_notify()
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Randomized note '{note_name}' using {randomization_type}. New note: {randomized_note_name}"
+            )
+        ]
+    
+    elif name == "word-count":
+        if not arguments:
+            raise ValueError("Missing arguments")
+        
+        note_name = arguments.get("note_name")
+
+        stored = notes.get(note_name)
+        if stored is None:
+            raise ValueError(f"Note '{note_name}' not found")
+
+        # A multi-MB transcript only pays the counting scan once; repeat
+        # queries on the unchanged note are a dict lookup
+        cached = _wc_cache.get(note_name)
+        if cached is not None and cached[0] is stored:
+            word_count = cached[1]
+        else:
+            word_count = sum(1 for _ in _WORD_RE.finditer(str(stored)))
+            _wc_cache[note_name] = (stored, word_count)
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Word count for note '{note_name}': {word_count} words"
+            )
+        ]
+    
+    elif name == "tag-note":
+        if not arguments:
+            raise ValueError("Missing arguments")
+        
+        note_name = arguments.get("note_name")
+        tags = arguments.get("tags", [])
+
+        async with _note_lock(note_name):
+            if notes.get(note_name) is None:
+                raise ValueError(f"Note '{note_name}' not found")
+
+            # Tags are stored as metadata and merged into the content on
+            # read, so tagging never copies the note body
+            note_tags.setdefault(note_name, []).extend(tags)
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"Added tags {tags} to note '{note_name}'"
+            )
+        ]
+    
+    elif name == "get-youtube-transcript":
+        if not arguments:
+            raise ValueError("Missing arguments")
+        
+        video_id = arguments.get("video_id")
+        language = arguments.get("language", None)
+
+        if not video_id:
+            raise ValueError("Video ID is required")
+
+        # Accept a single ID or a list; a list is fetched concurrently so
+        # K transcripts cost roughly one round-trip instead of K
+        video_ids = video_id if isinstance(video_id, list) else [video_id]
+
+        async def fetch_one(vid: str) -> str:
+            # Serve repeat queries from the TTL cache before paying for a
+            # network fetch
+            transcript_text = _cached_transcript(vid, language)
+            if transcript_text is None:
+                # Fetch the transcript off the event loop; the underlying HTTP
+                # calls are blocking and would stall every other MCP request
+                transcript_text = await asyncio.to_thread(_fetch_transcript, vid, language)
+                _store_transcript(vid, language, transcript_text)
+            return transcript_text
+
+        results = await asyncio.gather(
+            *(fetch_one(vid) for vid in video_ids), return_exceptions=True
+        )
+
+        contents = []
+        for vid, result in zip(video_ids, results):
+            if isinstance(result, BaseException):
+                contents.append(
+                    types.TextContent(
+                        type="text",
+                        text=f"Error fetching transcript: {str(result)}"
+                    )
+                )
+                continue
+
+            # Add the transcript as a note for persistence
+            note_name = sys.intern(f"transcript_{vid}")
+            async with _note_lock(note_name):
+                notes[note_name] = (
+                    _CompressedNote(result) if len(result) > _COMPRESS_MIN else result
+                )
+                _note_added(note_name)
+            _schedule_notify()
+
+            contents.append(
+                types.TextContent(
+                    type="text",
+                    text=f"Transcript fetched for video {vid}. Saved as note '{note_name}'. First 500 characters: {result[:500]}..."
+                )
+            )
+        return contents
+
+async def main():
+    # Run the server using stdin/stdout streams
+    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream,
+            write_stream,
+            InitializationOptions(
+                server_name="notes",
+                server_version="0.1.0",
+                capabilities=server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={},
+                ),
+            ),
+        )
+
+# If running the script directly
+if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
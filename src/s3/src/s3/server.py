@@ -1,806 +1,1476 @@
-import os
-import json
-import logging
-from typing import List, Dict, Optional
-from minio import Minio
-from mcp.server import types, NotificationOptions, Server
-from mcp.server.models import InitializationOptions
-from mcp.server.stdio import stdio_server
-from pydantic import AnyUrl
-
-# Configure logging
-logger = logging.getLogger(__name__)
-
-# Configuration file path (adjust as needed)
-CONFIG_FILE_PATH = os.path.expanduser(r"")
-
-def load_minio_config():
-    """
-    Load MinIO configuration from the S3 server configuration in Claude Desktop config file.
-    
-    Expected configuration structure:
-    {
-      "mcpServers": {
-        "s3": {
-          "command": "...",
-          "args": [...],
-          "minioConfig": {
-            "serverUrl": "",
-            "accessKey": "your_access_key",
-            "secretKey": "your_secret_key",
-            "secure": false
-          }
-        }
-      }
-    }
-    """
-    try:
-        with open(CONFIG_FILE_PATH, 'r') as config_file:
-            config = json.load(config_file)
-        
-        # Navigate to the S3 server configuration
-        s3_config = config.get('mcpServers', {}).get('s3', {})
-        
-        # Look for MinIO configuration
-        minio_config = s3_config.get('minioConfig', {})
-        
-        # Validate required fields
-        required_fields = ['serverUrl', 'accessKey', 'secretKey']
-        for field in required_fields:
-            if field not in minio_config:
-                raise ValueError(f"Missing required MinIO configuration: {field}")
-        
-        return {
-            'server_url': minio_config['serverUrl'],
-            'access_key': minio_config['accessKey'],
-            'secret_key': minio_config['secretKey'],
-            'secure': minio_config.get('secure', False)
-        }
-    except FileNotFoundError:
-        logger.error(f"Configuration file not found: {CONFIG_FILE_PATH}")
-        raise
-    except json.JSONDecodeError:
-        logger.error(f"Invalid JSON in configuration file: {CONFIG_FILE_PATH}")
-        raise
-    except ValueError as ve:
-        logger.error(str(ve))
-        raise
-
-def get_minio_client():
-    """
-    Lazily initialize and return MinIO client using dynamic configuration.
-    """
-    try:
-        config = load_minio_config()
-        return Minio(
-            config['server_url'],
-            access_key=config['access_key'],
-            secret_key=config['secret_key'],
-            secure=config['secure'],
-        )
-    except Exception as e:
-        logger.error(f"Failed to create MinIO client: {str(e)}")
-        raise
-
-# MCP Server instance
-server = Server("s3")
-
-@server.list_resources()
-async def handle_list_resources(uri: Optional[AnyUrl] = None) -> List[types.Resource]:
-    """
-    List available resources within the specified MinIO bucket.
-    If no URI is provided, list resources from the first available bucket.
-    """
-    minio_client = get_minio_client()
-    
-    # If no URI is provided, get the first bucket
-    if uri is None:
-        try:
-            buckets = list(minio_client.list_buckets())
-            if not buckets:
-                return []  # No buckets available
-            
-            # Use the first bucket as default
-            bucket_name = buckets[0].name
-            uri = AnyUrl(f"minio://{bucket_name}")
-        except Exception as e:
-            logger.error(f"Error listing buckets: {str(e)}")
-            return []
-    
-    try:
-        # Ensure uri is not None and has a path
-        if not uri or not uri.path:
-            logger.error("Invalid or empty URI provided")
-            return []
-        
-        # Extract bucket name, handling potential None values
-        bucket_name = uri.path.lstrip("/") if uri.path else ""
-        
-        if not bucket_name:
-            logger.error("No bucket name could be extracted from URI")
-            return []
-        
-        # Validate URI scheme
-        if uri.scheme != "minio":
-            logger.error(f"Unsupported URI scheme: {uri.scheme}")
-            return []
-        
-        # List objects in the bucket
-        objects = list(minio_client.list_objects(bucket_name))
-        return [
-            types.Resource(
-                name=obj.object_name,
-                uri=f"minio://{bucket_name}/{obj.object_name}",
-                description=f"Object size: {obj.size} bytes",
-            )
-            for obj in objects
-        ]
-    except Exception as e:
-        logger.error(f"Error listing resources for bucket {bucket_name}: {str(e)}")
-        return []
-
-@server.read_resource()
-async def handle_read_resource(uri: AnyUrl) -> str:
-    """
-    Read a resource (file) from the MinIO server.
-    """
-    if uri.scheme != "minio":
-        raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
-    
-    minio_client = get_minio_client()
-    bucket_name, _, object_name = uri.path.lstrip("/").partition("/")
-    try:
-        response = minio_client.get_object(bucket_name, object_name)
-        content = response.read()
-        return content.decode("utf-8")
-    except Exception as e:
-        logger.error(f"Error reading resource {uri}: {str(e)}")
-        raise
-
-@server.list_prompts()
-async def handle_list_prompts() -> List[types.Prompt]:
-    """
-    List prompts supported by the server.
-    """
-    return [
-        types.Prompt(
-            name="bucket_summary",
-            description="Summarize the contents of a bucket.",
-            arguments=[
-                types.PromptArgument(
-                    name="bucket_name",
-                    description="Name of the MinIO bucket to summarize.",
-                    required=True,
-                )
-            ],
-        ),
-
-        types.Prompt(
-            name="object_details",
-            description="Get detailed information about an object in a bucket.",
-            arguments=[
-                types.PromptArgument(
-                    name="bucket_name",
-                    description="Name of the MinIO bucket.",
-                    required=True,
-                ),
-                types.PromptArgument(
-                    name="object_name",
-                    description="Name of the object to get details for.",
-                    required=True,
-                )
-            ],
-        )
-    ]
-
-@server.get_prompt()
-async def handle_get_prompt(
-    name: str, arguments: Optional[Dict[str, str]]
-) -> types.GetPromptResult:
-    """
-    Generate a prompt based on its name and arguments.
-    """
-    if name == "bucket_summary":
-        bucket_name = arguments.get("bucket_name", "unknown_bucket")
-        return types.GetPromptResult(
-            description=f"Summarize the contents of bucket '{bucket_name}'.",
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(
-                        type="text", 
-                        text=f"Provide a comprehensive summary of the contents in the MinIO bucket named '{bucket_name}'."
-                    ),
-                )
-            ],
-        )
-    
-    elif name == "object_details":
-        bucket_name = arguments.get("bucket_name", "unknown_bucket")
-        object_name = arguments.get("object_name", "unknown_object")
-        return types.GetPromptResult(
-            description=f"Get details for object '{object_name}' in bucket '{bucket_name}'.",
-            messages=[
-                types.PromptMessage(
-                    role="user",
-                    content=types.TextContent(
-                        type="text", 
-                        text=f"Provide detailed information about the object named '{object_name}' in the MinIO bucket '{bucket_name}'."
-                    ),
-                )
-            ],
-        )
-    
-    else:
-        raise ValueError(f"Unknown prompt: {name}")
-
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """
-    List tools available for interacting with MinIO.
-    """
-    existing_tools = [
-        types.Tool(
-            name="list_buckets",
-            description="List all buckets in the MinIO server.",
-            inputSchema={"type": "object", "properties": {}, "additionalProperties": False}
-        ),
-        types.Tool(
-            name="read_bucket",
-            description="Read the contents of a specific bucket.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The bucket name."}
-                },
-                "required": ["bucket_name"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="bucket_size",
-            description="Calculate total size of a bucket.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The bucket name."}
-                },
-                "required": ["bucket_name"],
-                "additionalProperties": False
-            }
-        ),
-        # New tools
-        types.Tool(
-            name="make_bucket",
-            description="Create a new bucket in MinIO.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The name of the bucket to create."}
-                },
-                "required": ["bucket_name"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="remove_bucket",
-            description="Remove a bucket from MinIO.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The name of the bucket to remove."}
-                },
-                "required": ["bucket_name"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="list_objects",
-            description="List all objects in a bucket, including those in nested folders.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The name of the bucket."},
-                    "prefix": {
-                        "type": "string", 
-                        "description": "Optional prefix to filter objects (e.g., for a specific folder)."
-                    }
-                },
-                "required": ["bucket_name"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="fput_object",
-            description="Upload a file to a MinIO bucket, with intelligent filename handling.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The name of the bucket."},
-                    "object_name": {
-                        "type": "string", 
-                        "description": "Optional. The name to give the object in the bucket. If not provided, uses the original filename."
-                    },
-                    "file_path": {"type": "string", "description": "Local file path of the file to upload."},
-                    "prefix": {
-                        "type": "string", 
-                        "description": "Optional prefix/folder path within the bucket (e.g., 'data/documents')."
-                    }
-                },
-                "required": ["bucket_name", "file_path"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="fget_object",
-            description="Download object(s) from a MinIO bucket, with flexible download options.",
-            inputSchema={
-                "type": "object", 
-                "properties": {
-                    "bucket_name": {"type": "string", "description": "The name of the bucket."},
-                    "object_name": {
-                        "type": "string", 
-                        "description": "Optional. Specific object name to download. If not provided, uses prefix or downloads entire bucket."
-                    },
-                    "file_path": {"type": "string", "description": "Local file path or directory to save downloaded object(s)."},
-                    "prefix": {
-                        "type": "string", 
-                        "description": "Optional prefix to filter and download objects (e.g., 'data/documents')."
-                    }
-                },
-                "required": ["bucket_name", "file_path"],
-                "additionalProperties": False
-            }
-        )
-    ]
-    return existing_tools
-
-@server.call_tool()
-async def handle_call_tool(
-    name: str, arguments: Optional[Dict[str, str]] = None
-) -> List[types.TextContent]:
-    """
-    Execute a tool based on its name and arguments.
-    """
-    minio_client = get_minio_client()
-    arguments = arguments or {}  # Ensure arguments is not None
-
-    try:
-        if name == "list_buckets":
-            # List all buckets in MinIO
-            buckets = list(minio_client.list_buckets())
-            bucket_list = [
-                {
-                    "name": bucket.name,
-                    "creation_date": str(bucket.creation_date),
-                }
-                for bucket in buckets
-            ]
-            return [types.TextContent(type="text", text=json.dumps(bucket_list, indent=2))]
-        
-        elif name == "read_bucket":
-            # Read bucket contents
-            bucket_name = arguments.get("bucket_name")
-            if not bucket_name:
-                raise ValueError("Bucket name is required.")
-            
-            objects = list(minio_client.list_objects(bucket_name))
-            object_list = [
-                {"object_name": obj.object_name, "size": obj.size} for obj in objects
-            ]
-            return [types.TextContent(type="text", text=json.dumps(object_list, indent=2))]
-        
-        elif name == "bucket_size":
-            # Calculate total size of a bucket
-            bucket_name = arguments.get("bucket_name")
-            if not bucket_name:
-                raise ValueError("Bucket name is required.")
-            
-            objects = list(minio_client.list_objects(bucket_name))
-            total_size = sum(obj.size for obj in objects)
-            
-            return [types.TextContent(
-                type="text", 
-                text=json.dumps({
-                    "bucket_name": bucket_name,
-                    "total_objects": len(objects),
-                    "total_size_bytes": total_size,
-                    "total_size_mb": round(total_size / (1024 * 1024), 2)
-                }, indent=2)
-            )]
-        
-        elif name == "make_bucket":
-            # Create a new bucket
-            bucket_name = arguments.get("bucket_name")
-            if not bucket_name:
-                raise ValueError("Bucket name is required.")
-            
-            # Check if bucket already exists
-            try:
-                if minio_client.bucket_exists(bucket_name):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Bucket '{bucket_name}' already exists."
-                        }, indent=2)
-                    )]
-                
-                # Create the bucket
-                minio_client.make_bucket(bucket_name)
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "success",
-                        "message": f"Bucket '{bucket_name}' created successfully."
-                    }, indent=2)
-                )]
-            except Exception as e:
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "error",
-                        "message": f"Failed to create bucket: {str(e)}"
-                    }, indent=2)
-                )]
-        
-        elif name == "remove_bucket":
-            # Remove a bucket
-            bucket_name = arguments.get("bucket_name")
-            if not bucket_name:
-                raise ValueError("Bucket name is required.")
-            
-            try:
-                # Check if bucket exists before attempting to remove
-                if not minio_client.bucket_exists(bucket_name):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Bucket '{bucket_name}' does not exist."
-                        }, indent=2)
-                    )]
-                
-                # Remove all objects in the bucket first
-                objects = minio_client.list_objects(bucket_name, recursive=True)
-                for obj in objects:
-                    minio_client.remove_object(bucket_name, obj.object_name)
-                
-                # Remove the bucket
-                minio_client.remove_bucket(bucket_name)
-                
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "success",
-                        "message": f"Bucket '{bucket_name}' and all its contents removed successfully."
-                    }, indent=2)
-                )]
-            except Exception as e:
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "error",
-                        "message": f"Failed to remove bucket: {str(e)}"
-                    }, indent=2)
-                )]
-        
-        elif name == "list_objects":
-            # List objects in a bucket, supporting nested folders
-            bucket_name = arguments.get("bucket_name")
-            prefix = arguments.get("prefix", "")
-            
-            if not bucket_name:
-                raise ValueError("Bucket name is required.")
-            
-            try:
-                # Check if bucket exists
-                if not minio_client.bucket_exists(bucket_name):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Bucket '{bucket_name}' does not exist."
-                        }, indent=2)
-                    )]
-                
-                # List objects with optional prefix (for nested folders)
-                objects = list(minio_client.list_objects(
-                    bucket_name, 
-                    prefix=prefix, 
-                    recursive=True
-                ))
-                
-                # Organize objects into a structured format
-                object_list = [
-                    {
-                        "object_name": obj.object_name,
-                        "size": obj.size,
-                        "last_modified": str(obj.last_modified) if obj.last_modified else None,
-                        "is_dir": obj.object_name.endswith('/')
-                    } for obj in objects
-                ]
-                
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "bucket_name": bucket_name,
-                        "prefix": prefix or "root",
-                        "total_objects": len(object_list),
-                        "objects": object_list
-                    }, indent=2)
-                )]
-            except Exception as e:
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "error",
-                        "message": f"Failed to list objects: {str(e)}"
-                    }, indent=2)
-                )]
-        
-        elif name == "fput_object":
-            # Upload a file to a MinIO bucket with optional prefix and intelligent object naming
-            bucket_name = arguments.get("bucket_name")
-            object_name = arguments.get("object_name")
-            file_path = arguments.get("file_path")
-            prefix = arguments.get("prefix", "")
-            
-            # Validate inputs
-            if not all([bucket_name, file_path]):
-                raise ValueError("Bucket name and file path are required.")
-            
-            try:
-                # Check if bucket exists
-                if not minio_client.bucket_exists(bucket_name):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Bucket '{bucket_name}' does not exist."
-                        }, indent=2)
-                    )]
-                
-                # Check if file exists
-                if not os.path.exists(file_path):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Local file '{file_path}' does not exist."
-                        }, indent=2)
-                    )]
-                
-                # Determine object name
-                # If no object_name provided, use the original filename
-                if not object_name:
-                    object_name = os.path.basename(file_path)
-                
-                # Construct full object name with optional prefix
-                # Ensure the full object name (including extension) is preserved
-                full_object_name = f"{prefix.rstrip('/')}/{object_name}".lstrip('/')
-                
-                # Upload the file
-                minio_client.fput_object(bucket_name, full_object_name, file_path)
-                
-                # Get file stats to return details
-                file_stat = os.stat(file_path)
-                
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "success",
-                        "message": f"File uploaded successfully to bucket '{bucket_name}'.",
-                        "details": {
-                            "bucket_name": bucket_name,
-                            "object_name": full_object_name,
-                            "local_file_path": file_path,
-                            "file_size_bytes": file_stat.st_size
-                        }
-                    }, indent=2)
-                )]
-            except Exception as e:
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "error",
-                        "message": f"Failed to upload file: {str(e)}"
-                    }, indent=2)
-                )]
-        
-        elif name == "fget_object":
-            # Download an object or entire prefix from a MinIO bucket
-            bucket_name = arguments.get("bucket_name")
-            object_name = arguments.get("object_name", "")  # Optional
-            file_path = arguments.get("file_path")
-            prefix = arguments.get("prefix", "")  # Optional prefix to download
-            
-            # Validate inputs
-            if not all([bucket_name, file_path]):
-                raise ValueError("Bucket name and file path are required.")
-            
-            try:
-                # Check if bucket exists
-                if not minio_client.bucket_exists(bucket_name):
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "error",
-                            "message": f"Bucket '{bucket_name}' does not exist."
-                        }, indent=2)
-                    )]
-                
-                # Determine download strategy based on input
-                if object_name:
-                    # Download specific object
-                    try:
-                        minio_client.stat_object(bucket_name, object_name)
-                    except Exception:
-                        return [types.TextContent(
-                            type="text", 
-                            text=json.dumps({
-                                "status": "error",
-                                "message": f"Object '{object_name}' does not exist in bucket '{bucket_name}'."
-                            }, indent=2)
-                        )]
-                    
-                    # Download specific object
-                    minio_client.fget_object(bucket_name, object_name, file_path)
-                    file_stat = os.stat(file_path)
-                    
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "success",
-                            "message": f"File downloaded successfully from bucket '{bucket_name}'.",
-                            "details": {
-                                "bucket_name": bucket_name,
-                                "object_name": object_name,
-                                "local_file_path": file_path,
-                                "file_size_bytes": file_stat.st_size
-                            }
-                        }, indent=2)
-                    )]
-                
-                elif prefix:
-                    # Download entire prefix
-                    objects = list(minio_client.list_objects(
-                        bucket_name, 
-                        prefix=prefix, 
-                        recursive=True
-                    ))
-                    
-                    if not objects:
-                        return [types.TextContent(
-                            type="text", 
-                            text=json.dumps({
-                                "status": "error",
-                                "message": f"No objects found with prefix '{prefix}' in bucket '{bucket_name}'."
-                            }, indent=2)
-                        )]
-                    
-                    # Ensure the destination directory exists
-                    os.makedirs(file_path, exist_ok=True)
-                    
-                    downloaded_files = []
-                    for obj in objects:
-                        # Skip directory placeholders
-                        if obj.object_name.endswith('/'):
-                            continue
-                        
-                        # Maintain folder structure
-                        relative_path = obj.object_name[len(prefix):].lstrip('/')
-                        dest_path = os.path.join(file_path, relative_path)
-                        
-                        # Create necessary subdirectories
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        
-                        # Download object
-                        minio_client.fget_object(bucket_name, obj.object_name, dest_path)
-                        
-                        downloaded_files.append({
-                            "object_name": obj.object_name,
-                            "local_path": dest_path,
-                            "size": obj.size
-                        })
-                    
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "success",
-                            "message": f"Downloaded {len(downloaded_files)} files from prefix '{prefix}' in bucket '{bucket_name}'.",
-                            "details": {
-                                "bucket_name": bucket_name,
-                                "prefix": prefix,
-                                "local_destination": file_path,
-                                "downloaded_files": downloaded_files
-                            }
-                        }, indent=2)
-                    )]
-                
-                else:
-                    # If no object_name or prefix specified, download entire bucket
-                    objects = list(minio_client.list_objects(bucket_name, recursive=True))
-                    
-                    if not objects:
-                        return [types.TextContent(
-                            type="text", 
-                            text=json.dumps({
-                                "status": "error",
-                                "message": f"No objects found in bucket '{bucket_name}'."
-                            }, indent=2)
-                        )]
-                    
-                    # Ensure the destination directory exists
-                    os.makedirs(file_path, exist_ok=True)
-                    
-                    downloaded_files = []
-                    for obj in objects:
-                        # Skip directory placeholders
-                        if obj.object_name.endswith('/'):
-                            continue
-                        
-                        # Maintain folder structure
-                        dest_path = os.path.join(file_path, obj.object_name)
-                        
-                        # Create necessary subdirectories
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                        
-                        # Download object
-                        minio_client.fget_object(bucket_name, obj.object_name, dest_path)
-                        
-                        downloaded_files.append({
-                            "object_name": obj.object_name,
-                            "local_path": dest_path,
-                            "size": obj.size
-                        })
-                    
-                    return [types.TextContent(
-                        type="text", 
-                        text=json.dumps({
-                            "status": "success",
-                            "message": f"Downloaded {len(downloaded_files)} files from bucket '{bucket_name}'.",
-                            "details": {
-                                "bucket_name": bucket_name,
-                                "local_destination": file_path,
-                                "downloaded_files": downloaded_files
-                            }
-                        }, indent=2)
-                    )]
-            
-            except Exception as e:
-                return [types.TextContent(
-                    type="text", 
-                    text=json.dumps({
-                        "status": "error",
-                        "message": f"Failed to download file(s): {str(e)}"
-                    }, indent=2)
-                )]
-        
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-    except Exception as e:
-        logger.error(f"Error in tool {name}: {str(e)}")
-        raise
-
-async def main():
-    """
-    Main entry point for the MCP server tool.
-    """
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="minIO",
-                server_version="0.3.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
-                ),
-            ),
-        )
-
-if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+import asyncio
+import atexit
+import base64
+import os
+import random
+import time
+import json
+import logging
+import mmap
+import re
+import threading
+from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Optional
+from mcp.server import types, NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from mcp.server.stdio import stdio_server
+from pydantic import AnyUrl
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# orjson is a C JSON encoder; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fastjsonschema compiles each schema into a specialized validator function;
+# argument validation is skipped when it isn't installed
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_loads = json.loads if orjson is None else orjson.loads
+
+if orjson is not None:
+    def _dumps_indent(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+else:
+    def _dumps_indent(obj):
+        return json.dumps(obj, indent=2, default=str)
+
+# Configuration file path (adjust as needed)
+CONFIG_FILE_PATH = os.path.expanduser(r"")
+
+def load_minio_config():
+    """
+    Load MinIO configuration from the S3 server configuration in Claude Desktop config file.
+    
+    Expected configuration structure:
+    {
+      "mcpServers": {
+        "s3": {
+          "command": "...",
+          "args": [...],
+          "minioConfig": {
+            "serverUrl": "",
+            "accessKey": "your_access_key",
+            "secretKey": "your_secret_key",
+            "secure": false
+          }
+        }
+      }
+    }
+    """
+    try:
+        # One read() of the whole file beats json.load's buffered small
+        # reads through the file object
+        config = _loads(Path(CONFIG_FILE_PATH).read_bytes())
+        
+        # Navigate to the S3 server configuration
+        s3_config = config.get('mcpServers', {}).get('s3', {})
+        
+        # Look for MinIO configuration
+        minio_config = s3_config.get('minioConfig', {})
+        
+        # Validate required fields
+        required_fields = ['serverUrl', 'accessKey', 'secretKey']
+        for field in required_fields:
+            if field not in minio_config:
+                raise ValueError(f"Missing required MinIO configuration: {field}")
+        
+        return {
+            'server_url': minio_config['serverUrl'],
+            'access_key': minio_config['accessKey'],
+            'secret_key': minio_config['secretKey'],
+            'secure': minio_config.get('secure', False)
+        }
+    except FileNotFoundError:
+        logger.error(f"Configuration file not found: {CONFIG_FILE_PATH}")
+        raise
+    except json.JSONDecodeError:
+        logger.error(f"Invalid JSON in configuration file: {CONFIG_FILE_PATH}")
+        raise
+    except ValueError as ve:
+        logger.error(str(ve))
+        raise
+
+_minio_imported = False
+
+def _import_minio():
+    """
+    Import the minio stack (urllib3, certifi, XML parsing) on first use so
+    the stdio handshake starts before any storage call needs it.
+    """
+    global _minio_imported, Minio, DeleteObject, S3Error, urllib3
+    if _minio_imported:
+        return
+    from minio import Minio
+    from minio.deleteobjects import DeleteObject
+    from minio.error import S3Error
+    import urllib3
+    _minio_imported = True
+
+# Shared client state: rebuilding a client per call re-reads the config
+# file and throws away the warm urllib3 pool (a TLS handshake per request)
+_client_lock = threading.Lock()
+_minio_client = None
+_minio_pool = None
+_config_mtime = None
+
+def get_minio_client():
+    """
+    Return the shared MinIO client, rebuilding it only when the
+    configuration file changes on disk.
+    """
+    global _minio_client, _minio_pool, _config_mtime
+    _import_minio()
+    try:
+        mtime = os.stat(CONFIG_FILE_PATH).st_mtime
+    except OSError:
+        mtime = None
+
+    with _client_lock:
+        if _minio_client is not None and mtime == _config_mtime:
+            return _minio_client
+        try:
+            config = load_minio_config()
+            if _minio_pool is not None:
+                # Drop the previous client's keep-alive sockets when the
+                # config changes instead of leaking them
+                _minio_pool.clear()
+            # Persistent pool sized for the parallel download fan-out,
+            # with retries and timeouts the default client lacks
+            _minio_pool = urllib3.PoolManager(
+                num_pools=16,
+                maxsize=max(32, _DOWNLOAD_WORKERS * 2),
+                block=False,
+                retries=urllib3.util.Retry(
+                    total=5,
+                    backoff_factor=0.2,
+                    status_forcelist=[500, 502, 503, 504],
+                ),
+                timeout=urllib3.util.Timeout(connect=5, read=60),
+            )
+            _minio_client = Minio(
+                config['server_url'],
+                access_key=config['access_key'],
+                secret_key=config['secret_key'],
+                secure=config['secure'],
+                http_client=_minio_pool,
+            )
+            _config_mtime = mtime
+            return _minio_client
+        except Exception as e:
+            logger.error(f"Failed to create MinIO client: {str(e)}")
+            raise
+
+@lru_cache(maxsize=128)
+def _missing_bucket_text(bucket_name):
+    """
+    Serialized NoSuchBucket payload, cached per bucket name: the text is
+    constant per bucket and misconfigured callers (e.g. an indexer
+    polling a deleted bucket) tend to hammer the same name repeatedly.
+    """
+    return _dumps_indent({
+        "status": "error",
+        "message": f"Bucket '{bucket_name}' does not exist."
+    })
+
+def _missing_bucket_response(bucket_name):
+    """Error payload returned when the server reports NoSuchBucket."""
+    return [types.TextContent(type="text", text=_missing_bucket_text(bucket_name))]
+
+# Cap on concurrently executing blocking SDK calls, so a burst of tool
+# requests can't spawn unbounded worker threads
+_SEM = asyncio.Semaphore(32)
+
+async def _aio(fn, *args):
+    """Run a blocking callable in a worker thread, bounded by _SEM."""
+    async with _SEM:
+        return await asyncio.to_thread(fn, *args)
+
+# Files above this size are uploaded as parallel multipart parts
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+# Objects above this size are fetched as parallel 8 MiB ranged GETs
+_RANGE_CHUNK = 8 * 1024 * 1024
+
+# Cap on ranged GETs per object, so one huge object inside a bulk
+# download can't monopolize the transfer pool
+_RANGE_WORKERS = 16
+
+# Concurrent listings per sharded enumeration; each first-level folder
+# pages through MinIO's 1000-key limit independently
+_LIST_WORKERS = 16
+
+def _parallel_list(minio_client, bucket_name, prefix=""):
+    """
+    Recursively list a prefix by fanning one listing out per first-level
+    folder, so a large bucket's sequential page walk overlaps instead of
+    serializing. Results keep the lexicographic order of a plain
+    recursive listing.
+    """
+    first_level = list(minio_client.list_objects(bucket_name, prefix=prefix))
+    folders = [obj.object_name for obj in first_level if obj.object_name.endswith('/')]
+    if not folders:
+        return first_level
+
+    with ThreadPoolExecutor(max_workers=min(len(folders), _LIST_WORKERS)) as executor:
+        expanded = dict(zip(folders, executor.map(
+            lambda folder: list(minio_client.list_objects(
+                bucket_name, prefix=folder, recursive=True)),
+            folders,
+        )))
+
+    return list(chain.from_iterable(
+        expanded[obj.object_name] if obj.object_name.endswith('/') else (obj,)
+        for obj in first_level
+    ))
+
+def _sharded_listing(minio_client, bucket_name, prefix=""):
+    """
+    Stream a whole-bucket listing sharded one sub-listing per first-level
+    folder, yielding each shard as soon as it completes. Page walks for
+    different prefixes overlap and downloads start without waiting for
+    the slowest shard.
+    """
+    first_level = list(minio_client.list_objects(bucket_name, prefix=prefix))
+    folders = [obj.object_name for obj in first_level
+               if obj.object_name.endswith('/')]
+    yield from (obj for obj in first_level
+                if not obj.object_name.endswith('/'))
+    if not folders:
+        return
+    with ThreadPoolExecutor(max_workers=min(len(folders), _LIST_WORKERS)) as executor:
+        futures = [
+            executor.submit(
+                lambda folder=folder: list(minio_client.list_objects(
+                    bucket_name, prefix=folder, recursive=True)))
+            for folder in folders
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+# Concurrent transfers per bulk download; each fget_object blocks on a
+# full HTTPS round trip, so overlapping them collapses N serial RTTs
+_DOWNLOAD_WORKERS = int(os.getenv("S3_DL_CONCURRENCY", "32"))
+
+# One persistent transfer pool for the process: per-call pools pay
+# thread startup and teardown on every invocation, which dominates
+# small-bucket latency once the urllib3 sockets are already warm
+_DL_POOL = ThreadPoolExecutor(
+    max_workers=_DOWNLOAD_WORKERS, thread_name_prefix="s3dl")
+atexit.register(_DL_POOL.shutdown, wait=False)
+
+# Objects above this size download as parallel ranged GETs; one HTTP
+# connection tops out well below what the NIC can carry
+_RANGED_GET_MIN = 16 * 1024 * 1024
+
+# When MinIO's data directory is mounted on this host (FS gateway or
+# same-host deployment), point S3_LOCAL_FS_PATH at it to copy objects
+# in-kernel instead of over HTTP
+_LOCAL_FS_ROOT = os.getenv("S3_LOCAL_FS_PATH")
+
+def _copy_local(bucket_name, object_name, dest_path):
+    """
+    Copy an object straight from a locally mounted MinIO data directory
+    with copy_file_range (zero userspace copies, no HTTP round trip).
+    Returns False when the source file or the syscall isn't available,
+    so the caller falls through to the network path.
+    """
+    if _LOCAL_FS_ROOT is None or not hasattr(os, "copy_file_range"):
+        return False
+    src = f"{_LOCAL_FS_ROOT}/{bucket_name}/{object_name}"
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        dst_fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        finally:
+            os.close(dst_fd)
+    except OSError:
+        # Cross-device or unsupported filesystem: let the HTTP path run
+        return False
+    finally:
+        os.close(src_fd)
+    return True
+
+# O_DIRECT is Linux-only; elsewhere direct_io silently falls back to
+# page-cached writes
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+_DIRECT_ALIGN = 4096
+
+def _fetch_object_direct(minio_client, bucket_name, object_name, dest_path):
+    """
+    Stream one object to disk through O_DIRECT so bulk dataset dumps do
+    not evict other processes' working sets from the page cache. Response
+    chunks are staged in a page-aligned mmap buffer and written in
+    4 KiB-aligned multiples; the unaligned tail goes through a regular fd.
+    """
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DIRECT)
+    buf = mmap.mmap(-1, 1 << 20)
+    view = memoryview(buf)
+    filled = 0
+    offset = 0
+    response = minio_client.get_object(bucket_name, object_name)
+    try:
+        for chunk in response.stream(amt=1 << 20):
+            pos = 0
+            while pos < len(chunk):
+                take = min(len(chunk) - pos, len(view) - filled)
+                view[filled:filled + take] = chunk[pos:pos + take]
+                filled += take
+                pos += take
+                if filled == len(view):
+                    os.write(fd, view)
+                    offset += filled
+                    filled = 0
+        tail = filled % _DIRECT_ALIGN
+        aligned = filled - tail
+        if aligned:
+            os.write(fd, view[:aligned])
+            offset += aligned
+        os.close(fd)
+        fd = -1
+        if tail:
+            tail_fd = os.open(dest_path, os.O_WRONLY)
+            try:
+                os.lseek(tail_fd, offset, os.SEEK_SET)
+                os.write(tail_fd, view[aligned:aligned + tail])
+            finally:
+                os.close(tail_fd)
+    finally:
+        if fd >= 0:
+            os.close(fd)
+        view.release()
+        buf.close()
+        response.close()
+        response.release_conn()
+
+def _fetch_object(minio_client, bucket_name, object_name, dest_path, size=None,
+                  direct=False):
+    """
+    Download one object to dest_path, splitting large objects into
+    parallel 8 MiB ranged GETs written at their file offsets.
+    """
+    if _copy_local(bucket_name, object_name, dest_path):
+        return
+    if direct and _O_DIRECT:
+        _fetch_object_direct(minio_client, bucket_name, object_name, dest_path)
+        return
+    if size is None:
+        size = minio_client.stat_object(bucket_name, object_name).size
+    if size and size <= _RANGE_CHUNK:
+        # Small objects: one read and one write instead of the SDK's
+        # chunked part-file-and-rename loop — on a many-small-files bulk
+        # download the syscall count per object drops to a handful
+        resp = minio_client.get_object(bucket_name, object_name)
+        try:
+            chunk = resp.read()
+        finally:
+            resp.close()
+            resp.release_conn()
+        fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        try:
+            os.write(fd, chunk)
+        finally:
+            os.close(fd)
+        return
+    if not size or size <= _RANGED_GET_MIN:
+        minio_client.fget_object(bucket_name, object_name, dest_path)
+        return
+
+    fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    write_lock = threading.Lock()
+    try:
+        os.ftruncate(fd, size)
+
+        def _pull(offset):
+            # Small stagger so the parallel ranges don't all hit TCP
+            # slow-start in lockstep
+            time.sleep(random.random() * 0.05)
+            length = min(_RANGE_CHUNK, size - offset)
+            resp = minio_client.get_object(
+                bucket_name, object_name, offset=offset, length=length)
+            try:
+                chunk = resp.read()
+            finally:
+                resp.close()
+                resp.release_conn()
+            if hasattr(os, "pwrite"):
+                os.pwrite(fd, chunk, offset)
+            else:
+                # Windows has no pwrite; serialize the short writes instead
+                with write_lock:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    os.write(fd, chunk)
+
+        offsets = range(0, size, _RANGE_CHUNK)
+        with ThreadPoolExecutor(
+            max_workers=min(len(offsets), _RANGE_WORKERS)
+        ) as executor:
+            list(executor.map(_pull, offsets))
+    finally:
+        os.close(fd)
+
+def _real_objects(listing):
+    """
+    Filter directory-placeholder keys out of a listing as a generator, so
+    the download loops never see them and the check runs once at the
+    listing boundary instead of as a per-iteration branch in each loop.
+    """
+    return (o for o in listing if not o.object_name.endswith('/'))
+
+def _parent_dir(path):
+    """
+    Parent directory via one C-level rfind instead of os.path.dirname's
+    split machinery; measurable in the per-object scheduling loop on
+    million-entry downloads. Object keys always use '/' separators.
+    """
+    i = path.rfind('/')
+    return path[:i] if i > 0 else ''
+
+# Per-object retry budget for transient transfer failures
+_DOWNLOAD_ATTEMPTS = 6
+
+def _fetch_with_retry(minio_client, bucket_name, object_name, dest_path, size=None,
+                      direct=False):
+    """
+    Fetch one object, retrying transient S3/HTTP failures with exponential
+    backoff plus jitter. Returns None on success, or a failure record so a
+    single flaky object degrades the batch instead of aborting it.
+    """
+    for attempt in range(_DOWNLOAD_ATTEMPTS):
+        try:
+            _fetch_object(minio_client, bucket_name, object_name, dest_path, size,
+                          direct)
+            return None
+        except (S3Error, urllib3.exceptions.HTTPError) as e:
+            if attempt == _DOWNLOAD_ATTEMPTS - 1:
+                logger.error(f"Giving up on '{object_name}' after "
+                             f"{_DOWNLOAD_ATTEMPTS} attempts: {str(e)}")
+                return {"object_name": object_name, "error": str(e)}
+            time.sleep(min(30, 0.2 * 2 ** attempt) + random.random() * 0.1)
+
+# Cap on in-flight download futures (and their object metadata) when
+# draining a listing generator, so a multi-million-object bucket never
+# accumulates its whole listing in memory
+_DOWNLOAD_QUEUE_MAX = 10_000
+
+def _download_stream(minio_client, bucket_name, listing, dest_for, direct=False):
+    """
+    Drain a listing generator straight into the download pool, keeping
+    only a bounded window of metadata and futures resident.
+    """
+    count = 0
+    total_bytes = 0
+    # Only a bounded sample of filenames is kept for the response; the
+    # full per-file list for a million-object bucket would dwarf the
+    # bounded in-flight window this helper exists to maintain
+    sample = deque(maxlen=1000)
+    failed = []
+    created_dirs = set()
+    window = deque()
+
+    def _drain_one():
+        nonlocal count, total_bytes
+        object_name, dest, size, future = window.popleft()
+        failure = future.result()
+        if failure is not None:
+            failed.append(failure)
+        else:
+            count += 1
+            total_bytes += size or 0
+            sample.append(
+                {"object_name": object_name, "local_path": dest, "size": size})
+
+    def _batched(iterable, size=1000):
+        # Sort each bounded batch by key so objects sharing a prefix are
+        # written back to back, keeping the kernel's dentry cache warm
+        # for the target directories without materializing the listing
+        batch = []
+        for obj in iterable:
+            batch.append(obj)
+            if len(batch) >= size:
+                batch.sort(key=lambda o: o.object_name)
+                yield from batch
+                batch.clear()
+        batch.sort(key=lambda o: o.object_name)
+        yield from batch
+
+    for obj in _batched(_real_objects(listing)):
+        dest = dest_for(obj.object_name)
+        directory = _parent_dir(dest)
+        if directory and directory not in created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            # Remember the ancestors too — makedirs just created them,
+            # so later siblings skip their stat+mkdir entirely
+            while directory and directory not in created_dirs:
+                created_dirs.add(directory)
+                directory = _parent_dir(directory)
+        window.append((obj.object_name, dest, obj.size, _DL_POOL.submit(
+            _fetch_with_retry, minio_client, bucket_name,
+            obj.object_name, dest, obj.size, direct)))
+        if len(window) >= _DOWNLOAD_QUEUE_MAX:
+            _drain_one()
+    while window:
+        _drain_one()
+    return count, total_bytes, list(sample), failed
+
+def _download_objects(minio_client, bucket_name, objects, dest_for, direct=False):
+    """
+    Download many objects concurrently through a thread pool and return
+    the downloaded-files summary entries.
+    """
+    # The task entries double as the downloaded-files summary, so the
+    # result list exists before the pool runs and no second pass rebuilds it
+    tasks = [
+        {"object_name": obj.object_name,
+         "local_path": dest_for(obj.object_name),
+         "size": obj.size}
+        for obj in _real_objects(objects)
+    ]
+    if not tasks:
+        return [], []
+
+    # Group writes by destination directory (stable, so in-directory key
+    # order survives) before fanning out; consecutive writes into the
+    # same directory hit warm dentry-cache entries
+    tasks.sort(key=lambda task: _parent_dir(task["local_path"]))
+
+    # Create every target directory once, deduplicated, before the
+    # workers start racing to write into them; ancestors of a deeper
+    # directory are skipped since makedirs creates them implicitly
+    directories = sorted(
+        {_parent_dir(task["local_path"]) for task in tasks}
+        - {''}
+    )
+    for i, directory in enumerate(directories):
+        if i + 1 < len(directories) and directories[i + 1].startswith(directory + os.sep):
+            continue
+        os.makedirs(directory, exist_ok=True)
+
+    failures = list(_DL_POOL.map(
+        lambda task: _fetch_with_retry(
+            minio_client, bucket_name,
+            task["object_name"], task["local_path"], task["size"], direct),
+        tasks,
+    ))
+
+    failed = [failure for failure in failures if failure is not None]
+    if failed:
+        missed = {failure["object_name"] for failure in failed}
+        tasks = [task for task in tasks if task["object_name"] not in missed]
+    return tasks, failed
+
+def _decode_content(data) -> str:
+    """
+    Decode object bytes as UTF-8, falling back to a base64-tagged string
+    for binary objects instead of raising UnicodeDecodeError.
+    """
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return "base64:" + base64.b64encode(data).decode("ascii")
+
+# Single compiled match for minio:// URIs; str ops plus Pydantic URL
+# re-validation are much slower in the per-request path
+_URI_RE = re.compile(r"^minio://([^/]+)(?:/(.*))?$")
+
+# MCP Server instance
+server = Server("s3")
+
+@server.list_resources()
+async def handle_list_resources(uri: Optional[AnyUrl] = None) -> List[types.Resource]:
+    """
+    List available resources within the specified MinIO bucket.
+    If no URI is provided, list resources from the first available bucket.
+    """
+    minio_client = get_minio_client()
+    
+    # If no URI is provided, get the first bucket
+    if uri is None:
+        try:
+            buckets = await _aio(lambda: list(minio_client.list_buckets()))
+            if not buckets:
+                return []  # No buckets available
+            
+            # Use the first bucket as default
+            bucket_name = buckets[0].name
+        except Exception as e:
+            logger.error(f"Error listing buckets: {str(e)}")
+            return []
+    else:
+        match = _URI_RE.match(str(uri))
+        if not match:
+            logger.error(f"Invalid MinIO URI: {uri}")
+            return []
+        bucket_name = match.group(1)
+    
+    try:
+        # List objects in the bucket
+        objects = await _aio(
+            lambda: list(minio_client.list_objects(bucket_name)))
+        return [
+            types.Resource(
+                name=obj.object_name,
+                uri=f"minio://{bucket_name}/{obj.object_name}",
+                description=f"Object size: {obj.size} bytes",
+            )
+            for obj in objects
+        ]
+    except Exception as e:
+        logger.error(f"Error listing resources for bucket {bucket_name}: {str(e)}")
+        return []
+
+@server.read_resource()
+async def handle_read_resource(uri: AnyUrl) -> str:
+    """
+    Read a resource (file) from the MinIO server.
+    """
+    match = _URI_RE.match(str(uri))
+    if not match:
+        raise ValueError(f"Unsupported URI scheme: {uri.scheme}")
+    bucket_name, object_name = match.group(1), match.group(2) or ""
+
+    def _fetch() -> str:
+        minio_client = get_minio_client()
+
+        size = minio_client.stat_object(bucket_name, object_name).size
+        if size and size > _RANGE_CHUNK:
+            # Pull ranges concurrently into a preallocated buffer; a
+            # single GET is bounded by one TCP stream's throughput
+            data = bytearray(size)
+
+            def _pull(offset):
+                length = min(_RANGE_CHUNK, size - offset)
+                resp = minio_client.get_object(
+                    bucket_name, object_name, offset=offset, length=length)
+                try:
+                    data[offset:offset + length] = resp.read()
+                finally:
+                    resp.close()
+                    resp.release_conn()
+
+            offsets = range(0, size, _RANGE_CHUNK)
+            with ThreadPoolExecutor(
+                max_workers=min(len(offsets), _DOWNLOAD_WORKERS)
+            ) as executor:
+                list(executor.map(_pull, offsets))
+            return _decode_content(data)
+
+        response = minio_client.get_object(bucket_name, object_name)
+        try:
+            # Stream 256 KiB chunks into a buffer preallocated from the
+            # stat size, so the payload is never reassembled from pieces
+            data = bytearray(size) if size else bytearray()
+            pos = 0
+            for chunk in response.stream(amt=262144):
+                data[pos:pos + len(chunk)] = chunk
+                pos += len(chunk)
+            return _decode_content(data)
+        finally:
+            # Release the connection back to the urllib3 pool
+            response.close()
+            response.release_conn()
+
+    try:
+        return await _aio(_fetch)
+    except Exception as e:
+        logger.error(f"Error reading resource {uri}: {str(e)}")
+        raise
+
+# Static prompt and tool payloads built once at import; rebuilding the
+# Pydantic models on every list probe is pure validation overhead
+_PROMPTS_CACHE: List[types.Prompt] = [
+    types.Prompt(
+        name="bucket_summary",
+        description="Summarize the contents of a bucket.",
+        arguments=[
+            types.PromptArgument(
+                name="bucket_name",
+                description="Name of the MinIO bucket to summarize.",
+                required=True,
+            )
+        ],
+    ),
+
+    types.Prompt(
+        name="object_details",
+        description="Get detailed information about an object in a bucket.",
+        arguments=[
+            types.PromptArgument(
+                name="bucket_name",
+                description="Name of the MinIO bucket.",
+                required=True,
+            ),
+            types.PromptArgument(
+                name="object_name",
+                description="Name of the object to get details for.",
+                required=True,
+            )
+        ],
+    )
+]
+
+@server.list_prompts()
+async def handle_list_prompts() -> List[types.Prompt]:
+    """
+    List prompts supported by the server.
+    """
+    return _PROMPTS_CACHE
+
+# Prompt results only vary by name and arguments, and the result models
+# are immutable, so repeat requests share one cached instance instead of
+# re-running Pydantic validation
+@lru_cache(maxsize=1024)
+def _build_prompt(
+    name: str, bucket_name: str, object_name: Optional[str] = None
+) -> types.GetPromptResult:
+    if name == "bucket_summary":
+        return types.GetPromptResult(
+            description=f"Summarize the contents of bucket '{bucket_name}'.",
+            messages=[
+                types.PromptMessage(
+                    role="user",
+                    content=types.TextContent(
+                        type="text", 
+                        text=f"Provide a comprehensive summary of the contents in the MinIO bucket named '{bucket_name}'."
+                    ),
+                )
+            ],
+        )
+    
+    elif name == "object_details":
+        return types.GetPromptResult(
+            description=f"Get details for object '{object_name}' in bucket '{bucket_name}'.",
+            messages=[
+                types.PromptMessage(
+                    role="user",
+                    content=types.TextContent(
+                        type="text", 
+                        text=f"Provide detailed information about the object named '{object_name}' in the MinIO bucket '{bucket_name}'."
+                    ),
+                )
+            ],
+        )
+    
+    else:
+        raise ValueError(f"Unknown prompt: {name}")
+
+@server.get_prompt()
+async def handle_get_prompt(
+    name: str, arguments: Optional[Dict[str, str]]
+) -> types.GetPromptResult:
+    """
+    Generate a prompt based on its name and arguments.
+    """
+    arguments = arguments or {}
+    return _build_prompt(
+        name,
+        arguments.get("bucket_name", "unknown_bucket"),
+        arguments.get("object_name", "unknown_object"),
+    )
+
+_TOOLS_CACHE: List[types.Tool] = [
+    types.Tool(
+        name="list_buckets",
+        description="List all buckets in the MinIO server.",
+        inputSchema={"type": "object", "properties": {}, "additionalProperties": False}
+    ),
+    types.Tool(
+        name="read_bucket",
+        description="Read the contents of a specific bucket.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The bucket name."}
+            },
+            "required": ["bucket_name"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="bucket_size",
+        description="Calculate total size of a bucket.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The bucket name."}
+            },
+            "required": ["bucket_name"],
+            "additionalProperties": False
+        }
+    ),
+    # New tools
+    types.Tool(
+        name="make_bucket",
+        description="Create a new bucket in MinIO.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The name of the bucket to create."}
+            },
+            "required": ["bucket_name"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="remove_bucket",
+        description="Remove a bucket from MinIO.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The name of the bucket to remove."}
+            },
+            "required": ["bucket_name"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="list_objects",
+        description="List all objects in a bucket, including those in nested folders.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The name of the bucket."},
+                "prefix": {
+                    "type": "string", 
+                    "description": "Optional prefix to filter objects (e.g., for a specific folder)."
+                },
+                "start_after": {
+                    "type": "string", 
+                    "description": "Optional object name to start listing after, for pagination."
+                },
+                "max_keys": {
+                    "type": "integer", 
+                    "description": "Optional maximum number of objects to return."
+                }
+            },
+            "required": ["bucket_name"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="fput_object",
+        description="Upload a file to a MinIO bucket, with intelligent filename handling.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The name of the bucket."},
+                "object_name": {
+                    "type": "string", 
+                    "description": "Optional. The name to give the object in the bucket. If not provided, uses the original filename."
+                },
+                "file_path": {"type": "string", "description": "Local file path of the file to upload."},
+                "prefix": {
+                    "type": "string", 
+                    "description": "Optional prefix/folder path within the bucket (e.g., 'data/documents')."
+                }
+            },
+            "required": ["bucket_name", "file_path"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="fget_object",
+        description="Download object(s) from a MinIO bucket, with flexible download options.",
+        inputSchema={
+            "type": "object", 
+            "properties": {
+                "bucket_name": {"type": "string", "description": "The name of the bucket."},
+                "object_name": {
+                    "type": "string", 
+                    "description": "Optional. Specific object name to download. If not provided, uses prefix or downloads entire bucket."
+                },
+                "file_path": {"type": "string", "description": "Local file path or directory to save downloaded object(s)."},
+                "prefix": {
+                    "type": "string", 
+                    "description": "Optional prefix to filter and download objects (e.g., 'data/documents')."
+                },
+                "direct_io": {
+                    "type": "boolean",
+                    "description": "Optional. Bypass the OS page cache (O_DIRECT) when bulk-dumping large datasets; ignored on platforms without O_DIRECT."
+                }
+            },
+            "required": ["bucket_name", "file_path"],
+            "additionalProperties": False
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """
+    List tools available for interacting with MinIO.
+    """
+    return _TOOLS_CACHE
+
+# Validators compiled once at import; each call then pays one function
+# call instead of a reflective schema walk
+if fastjsonschema is not None:
+    _VALIDATORS = {
+        tool.name: fastjsonschema.compile(tool.inputSchema)
+        for tool in _TOOLS_CACHE
+    }
+else:
+    _VALIDATORS = {}
+
+def _tool_list_buckets(minio_client, arguments):
+    # List all buckets in MinIO
+    buckets = list(minio_client.list_buckets())
+    bucket_list = [
+        {
+            "name": bucket.name,
+            "creation_date": str(bucket.creation_date),
+        }
+        for bucket in buckets
+    ]
+    return [types.TextContent(type="text", text=_dumps_indent(bucket_list))]
+
+def _tool_read_bucket(minio_client, arguments):
+    # Read bucket contents
+    bucket_name = arguments.get("bucket_name")
+    if not bucket_name:
+        raise ValueError("Bucket name is required.")
+    
+    # Stream the paginated listing instead of materializing every
+    # page before processing
+    object_list = [
+        {"object_name": obj.object_name, "size": obj.size}
+        for obj in minio_client.list_objects(bucket_name)
+    ]
+    return [types.TextContent(type="text", text=_dumps_indent(object_list))]
+
+def _tool_bucket_size(minio_client, arguments):
+    # Calculate total size of a bucket
+    bucket_name = arguments.get("bucket_name")
+    if not bucket_name:
+        raise ValueError("Bucket name is required.")
+    
+    # Accumulate while streaming; object metadata is never retained,
+    # so memory stays bounded at one listing page
+    total_size = 0
+    total_objects = 0
+    for obj in minio_client.list_objects(bucket_name):
+        total_size += obj.size
+        total_objects += 1
+    
+    return [types.TextContent(
+        type="text", 
+        text=_dumps_indent({
+            "bucket_name": bucket_name,
+            "total_objects": total_objects,
+            "total_size_bytes": total_size,
+            "total_size_mb": round(total_size / (1024 * 1024), 2)
+        })
+    )]
+
+def _tool_make_bucket(minio_client, arguments):
+    # Create a new bucket
+    bucket_name = arguments.get("bucket_name")
+    if not bucket_name:
+        raise ValueError("Bucket name is required.")
+    
+    try:
+        # Create the bucket; the server reports a conflict itself, so no
+        # bucket_exists HEAD probe is needed beforehand
+        minio_client.make_bucket(bucket_name)
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "success",
+                "message": f"Bucket '{bucket_name}' created successfully."
+            })
+        )]
+    except S3Error as e:
+        if e.code in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "error",
+                    "message": f"Bucket '{bucket_name}' already exists."
+                })
+            )]
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to create bucket: {str(e)}"
+            })
+        )]
+    except Exception as e:
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to create bucket: {str(e)}"
+            })
+        )]
+
+def _tool_remove_bucket(minio_client, arguments):
+    # Remove a bucket
+    bucket_name = arguments.get("bucket_name")
+    if not bucket_name:
+        raise ValueError("Bucket name is required.")
+    
+    try:
+        # Remove all objects in the bucket first; bulk delete packs
+        # up to 1000 keys per request instead of one DELETE each
+        delete_list = (
+            DeleteObject(obj.object_name)
+            for obj in minio_client.list_objects(bucket_name, recursive=True)
+        )
+        errors = list(minio_client.remove_objects(bucket_name, delete_list))
+        if errors:
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "error",
+                    "message": f"Failed to remove {len(errors)} object(s) from bucket '{bucket_name}'.",
+                    "errors": [str(error) for error in errors]
+                })
+            )]
+        
+        # Remove the bucket
+        minio_client.remove_bucket(bucket_name)
+        
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "success",
+                "message": f"Bucket '{bucket_name}' and all its contents removed successfully."
+            })
+        )]
+    except S3Error as e:
+        if e.code == "NoSuchBucket":
+            return _missing_bucket_response(bucket_name)
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to remove bucket: {str(e)}"
+            })
+        )]
+    except Exception as e:
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to remove bucket: {str(e)}"
+            })
+        )]
+
+def _tool_list_objects(minio_client, arguments):
+    # List objects in a bucket, supporting nested folders
+    bucket_name = arguments.get("bucket_name")
+    prefix = arguments.get("prefix", "")
+    start_after = arguments.get("start_after", "")
+    max_keys = arguments.get("max_keys")
+    
+    if not bucket_name:
+        raise ValueError("Bucket name is required.")
+    
+    try:
+        # NoSuchBucket surfaces from the S3Error handler below, so no
+        # bucket_exists HEAD probe runs on the happy path
+        # List objects with optional prefix (for nested folders),
+        # streaming pages as they arrive and stopping early once
+        # max_keys entries have been collected; unpaginated requests
+        # fan the enumeration out across first-level folders
+        if max_keys or start_after:
+            listing = minio_client.list_objects(
+                bucket_name, 
+                prefix=prefix, 
+                recursive=True,
+                start_after=start_after
+            )
+        else:
+            listing = _parallel_list(minio_client, bucket_name, prefix)
+        limit = int(max_keys) if max_keys else None
+
+        if orjson is not None:
+            # Encode each record straight into the output buffer as it
+            # streams by; a 100k-object listing never materializes a list
+            # of per-object dicts
+            buf = bytearray()
+            count = 0
+            for obj in listing:
+                if count:
+                    buf += b","
+                buf += orjson.dumps({
+                    "object_name": obj.object_name,
+                    "size": obj.size,
+                    "last_modified": str(obj.last_modified) if obj.last_modified else None,
+                    "is_dir": obj.object_name.endswith('/')
+                })
+                count += 1
+                if limit and count >= limit:
+                    break
+            header = orjson.dumps({
+                "bucket_name": bucket_name,
+                "prefix": prefix or "root",
+                "total_objects": count,
+            })
+            return [types.TextContent(
+                type="text", 
+                text=header[:-1].decode() + ',"objects":[' + buf.decode() + ']}'
+            )]
+
+        object_list = []
+        for obj in listing:
+            object_list.append({
+                "object_name": obj.object_name,
+                "size": obj.size,
+                "last_modified": str(obj.last_modified) if obj.last_modified else None,
+                "is_dir": obj.object_name.endswith('/')
+            })
+            if limit and len(object_list) >= limit:
+                break
+        
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "bucket_name": bucket_name,
+                "prefix": prefix or "root",
+                "total_objects": len(object_list),
+                "objects": object_list
+            })
+        )]
+    except S3Error as e:
+        if e.code == "NoSuchBucket":
+            return _missing_bucket_response(bucket_name)
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to list objects: {str(e)}"
+            })
+        )]
+    except Exception as e:
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to list objects: {str(e)}"
+            })
+        )]
+
+def _tool_fput_object(minio_client, arguments):
+    # Upload a file to a MinIO bucket with optional prefix and intelligent object naming
+    bucket_name = arguments.get("bucket_name")
+    object_name = arguments.get("object_name")
+    file_path = arguments.get("file_path")
+    prefix = arguments.get("prefix", "")
+    
+    # Validate inputs
+    if not all([bucket_name, file_path]):
+        raise ValueError("Bucket name and file path are required.")
+    
+    try:
+        # Check if file exists
+        if not os.path.exists(file_path):
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "error",
+                    "message": f"Local file '{file_path}' does not exist."
+                })
+            )]
+        
+        # Determine object name
+        # If no object_name provided, use the original filename
+        if not object_name:
+            object_name = os.path.basename(file_path)
+        
+        # Construct full object name with optional prefix
+        # Ensure the full object name (including extension) is preserved
+        full_object_name = f"{prefix.rstrip('/')}/{object_name}".lstrip('/')
+        
+        # Get file stats before uploading
+        file_stat = os.stat(file_path)
+        
+        # Upload the file; large files go up as 16 MiB multipart
+        # parts pushed in parallel instead of one serial stream
+        if file_stat.st_size > _MULTIPART_THRESHOLD:
+            minio_client.fput_object(
+                bucket_name, full_object_name, file_path,
+                part_size=16 * 1024 * 1024,
+                num_parallel_uploads=4,
+            )
+        else:
+            minio_client.fput_object(bucket_name, full_object_name, file_path)
+        
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "success",
+                "message": f"File uploaded successfully to bucket '{bucket_name}'.",
+                "details": {
+                    "bucket_name": bucket_name,
+                    "object_name": full_object_name,
+                    "local_file_path": file_path,
+                    "file_size_bytes": file_stat.st_size
+                }
+            })
+        )]
+    except S3Error as e:
+        if e.code == "NoSuchBucket":
+            return _missing_bucket_response(bucket_name)
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to upload file: {str(e)}"
+            })
+        )]
+    except Exception as e:
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to upload file: {str(e)}"
+            })
+        )]
+
+def _tool_fget_object(minio_client, arguments):
+    # Download an object or entire prefix from a MinIO bucket
+    bucket_name = arguments.get("bucket_name")
+    object_name = arguments.get("object_name", "")  # Optional
+    file_path = arguments.get("file_path")
+    prefix = arguments.get("prefix", "")  # Optional prefix to download
+    direct = bool(arguments.get("direct_io", False))
+    
+    # Validate inputs
+    if not all([bucket_name, file_path]):
+        raise ValueError("Bucket name and file path are required.")
+    
+    try:
+        # Determine download strategy based on input
+        if object_name:
+            # Download specific object
+            try:
+                stat = minio_client.stat_object(bucket_name, object_name)
+            except Exception:
+                return [types.TextContent(
+                    type="text", 
+                    text=_dumps_indent({
+                        "status": "error",
+                        "message": f"Object '{object_name}' does not exist in bucket '{bucket_name}'."
+                    })
+                )]
+            
+            # Download specific object
+            _fetch_object(minio_client, bucket_name, object_name, file_path, stat.size)
+            file_stat = os.stat(file_path)
+            
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "success",
+                    "message": f"File downloaded successfully from bucket '{bucket_name}'.",
+                    "details": {
+                        "bucket_name": bucket_name,
+                        "object_name": object_name,
+                        "local_file_path": file_path,
+                        "file_size_bytes": file_stat.st_size
+                    }
+                })
+            )]
+        
+        elif prefix:
+            # Download entire prefix, enumerating folders in parallel
+            objects = _parallel_list(minio_client, bucket_name, prefix)
+            
+            if not objects:
+                return [types.TextContent(
+                    type="text", 
+                    text=_dumps_indent({
+                        "status": "error",
+                        "message": f"No objects found with prefix '{prefix}' in bucket '{bucket_name}'."
+                    })
+                )]
+            
+            # Ensure the destination directory exists
+            os.makedirs(file_path, exist_ok=True)
+            
+            # Precompute the root prefix once; per-object destination is
+            # then a single string concat instead of an os.path.join parse
+            root = file_path.rstrip('/') + '/'
+            skip = len(prefix)
+            
+            # Download concurrently, maintaining folder structure
+            downloaded_files, failed_files = _download_objects(
+                minio_client, bucket_name, objects,
+                lambda object_name: root + object_name[skip:].lstrip('/'),
+                direct,
+            )
+            
+            details = {
+                "bucket_name": bucket_name,
+                "prefix": prefix,
+                "local_destination": file_path,
+                "downloaded_count": len(downloaded_files),
+                "total_bytes": sum(entry["size"] or 0 for entry in downloaded_files),
+                "sample": downloaded_files[:1000]
+            }
+            if failed_files:
+                details["failed_files"] = failed_files
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "partial" if failed_files else "success",
+                    "message": f"Downloaded {len(downloaded_files)} files from prefix '{prefix}' in bucket '{bucket_name}'.",
+                    "details": details
+                })
+            )]
+        
+        else:
+            # If no object_name or prefix specified, download the entire
+            # bucket, feeding the listing generator straight into the
+            # download pool so the full listing is never materialized
+            os.makedirs(file_path, exist_ok=True)
+            root = file_path.rstrip('/') + '/'
+            count, total_bytes, sample, failed_files = _download_stream(
+                minio_client, bucket_name,
+                _sharded_listing(minio_client, bucket_name),
+                lambda object_name: root + object_name,
+                direct,
+            )
+            
+            if not count and not failed_files:
+                return [types.TextContent(
+                    type="text", 
+                    text=_dumps_indent({
+                        "status": "error",
+                        "message": f"No objects found in bucket '{bucket_name}'."
+                    })
+                )]
+            
+            # Counters plus a bounded sample keep the response O(1) in
+            # bucket size instead of echoing every downloaded path back
+            details = {
+                "bucket_name": bucket_name,
+                "local_destination": file_path,
+                "downloaded_count": count,
+                "total_bytes": total_bytes,
+                "sample": sample
+            }
+            if failed_files:
+                details["failed_files"] = failed_files
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "partial" if failed_files else "success",
+                    "message": f"Downloaded {count} files from bucket '{bucket_name}'.",
+                    "details": details
+                })
+            )]
+    
+    except S3Error as e:
+        if e.code == "NoSuchBucket":
+            return _missing_bucket_response(bucket_name)
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to download file(s): {str(e)}"
+            })
+        )]
+    except Exception as e:
+        return [types.TextContent(
+            type="text", 
+            text=_dumps_indent({
+                "status": "error",
+                "message": f"Failed to download file(s): {str(e)}"
+            })
+        )]
+
+# O(1) tool dispatch instead of walking an eight-way elif chain per call
+_TOOL_DISPATCH = {
+    "list_buckets": _tool_list_buckets,
+    "read_bucket": _tool_read_bucket,
+    "bucket_size": _tool_bucket_size,
+    "make_bucket": _tool_make_bucket,
+    "remove_bucket": _tool_remove_bucket,
+    "list_objects": _tool_list_objects,
+    "fput_object": _tool_fput_object,
+    "fget_object": _tool_fget_object,
+}
+
+def _run_tool(
+    name: str, arguments: Optional[Dict[str, str]] = None
+) -> List[types.TextContent]:
+    """
+    Execute a tool synchronously. Runs in a worker thread so the blocking
+    MinIO SDK never stalls the event loop between concurrent tool calls.
+    """
+    handler = _TOOL_DISPATCH.get(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    try:
+        return handler(get_minio_client(), arguments or {})
+    except Exception as e:
+        logger.error(f"Error in tool {name}: {str(e)}")
+        raise
+
+@server.call_tool()
+async def handle_call_tool(
+    name: str, arguments: Optional[Dict[str, str]] = None
+) -> List[types.TextContent]:
+    """
+    Execute a tool based on its name and arguments.
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is not None:
+        try:
+            validator(arguments or {})
+        except fastjsonschema.JsonSchemaException as e:
+            return [types.TextContent(
+                type="text", 
+                text=_dumps_indent({
+                    "status": "error",
+                    "message": f"Invalid arguments: {e.message}"
+                })
+            )]
+    # The whole handler — including serializing a large response via
+    # _dumps_indent — runs on a worker thread, so a 100k-entry encode
+    # never stalls the stdio event loop for other in-flight calls
+    return await _aio(_run_tool, name, arguments)
+
+async def main():
+    """
+    Main entry point for the MCP server tool.
+    """
+    async with stdio_server() as (read_stream, write_stream):
+        await server.run(
+            read_stream,
+            write_stream,
+            InitializationOptions(
+                server_name="minIO",
+                server_version="0.3.0",
+                capabilities=server.get_capabilities(
+                    notification_options=NotificationOptions(),
+                    experimental_capabilities={},
+                ),
+            ),
+        )
+
+if __name__ == "__main__":
+    asyncio.run(main())